@@ -0,0 +1,18 @@
+import sys
+
+
+def main():
+    """
+    Punkt wejścia `python <katalog projektu>`: menu gry i turniejów (test2.main),
+    a z argumentem `daniel` - gra z daniel.Player. Moduły silników nie mają efektów
+    ubocznych przy imporcie, więc można je importować w procesach roboczych i benchmarkach.
+    """
+    if sys.argv[1:2] == ['daniel']:
+        from daniel import main as play
+    else:
+        from test2 import main as play
+    play()
+
+
+if __name__ == "__main__":
+    main()
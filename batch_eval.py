@@ -0,0 +1,133 @@
+from typing import List, Sequence
+
+import numpy as np
+
+from bitboard import BitBoard
+from lines import get_line_index
+from patterns import WINDOW_POWERS
+
+
+def board_to_array(game) -> np.ndarray:
+    """
+    Zamienia planszę (Game / BitBoard) na tablicę int8 o wymiarach (n_rows, n_columns).
+
+    Wiersz 0 to dół planszy (jak w game.board[col][row]); wartości to 0 dla pustego
+    pola, 1 dla pionka gracza 0 i 2 dla pionka gracza 1 - czyli cyfry kodu okna.
+    """
+    array = np.zeros((game.n_rows, game.n_columns), dtype=np.int8)
+    if isinstance(game, BitBoard):
+        # Pionki czytane bit po bicie z masek graczy
+        for player in (0, 1):
+            position = game.player_mask(player)
+            while position:
+                bit = position & -position
+                position ^= bit
+                col, row = divmod(bit.bit_length() - 1, game.column_height)
+                array[row, col] = player + 1
+        return array
+    for col, column in enumerate(game.board):
+        for row, piece in enumerate(column):
+            array[row, col] = piece + 1
+    return array
+
+
+class BatchEvaluator:
+    """
+    Wektorowa (NumPy) wersja UnbeatableAI.evaluate_position_advanced dla wielu pozycji
+    o tej samej geometrii naraz.
+
+    Pozycje podawane są jako tablica (N, n_rows, n_columns) w formacie board_to_array.
+    Okna są zbierane jednym indeksowaniem po współdzielonym indeksie linii, kodowane
+    w systemie trójkowym i oceniane odczytem z tych samych tablic, których używa
+    silnik (UnbeatableAI.get_line_tables), więc wynik zgadza się z oceną skalarną.
+    """
+
+    def __init__(self, n_rows: int, n_columns: int, winning_length: int,
+                 line_tables: Sequence[Sequence[float]]):
+        self.n_rows = n_rows
+        self.n_columns = n_columns
+        self.winning_length = winning_length
+
+        # Indeksy pól każdej linii w spłaszczonej planszy (row * n_columns + col)
+        line_index = get_line_index(n_rows, n_columns, winning_length)
+        self.line_cells = np.array([[row * n_columns + col for col, row in cells]
+                                    for cells in line_index.lines], dtype=np.intp)
+        self.powers = np.array(WINDOW_POWERS[:winning_length], dtype=np.int32)
+        self.tables = [np.asarray(table, dtype=np.float64) for table in line_tables]
+
+        # Wagi kontroli środka dla kolumn (jak w evaluate_center_control)
+        self.center_weights = np.zeros(n_columns)
+        for col in range(n_columns):
+            offset = abs(2 * col - (n_columns - 1)) // 2
+            if offset == 0:
+                self.center_weights[col] = 5
+            elif offset <= 2:
+                self.center_weights[col] = 3 / offset
+
+        # Premia za niskie pozycje (jak w evaluate_board_structure)
+        self.height_bonus = (n_rows - np.arange(n_rows)) * 0.5
+
+    def evaluate(self, boards: np.ndarray) -> np.ndarray:
+        """Ocenia N pozycji z perspektywy gracza na ruchu. Zwraca tablicę (N,) float64."""
+        boards = np.asarray(boards, dtype=np.int8).reshape(-1, self.n_rows, self.n_columns)
+        n_boards = boards.shape[0]
+        pieces = [boards == 1, boards == 2]
+
+        # Gracz na ruchu wynika z liczby pionków (zaczyna gracz 0)
+        counts = [pieces[0].sum(axis=(1, 2)), pieces[1].sum(axis=(1, 2))]
+        current = (counts[0] > counts[1]).astype(np.intp)
+        rows = np.arange(n_boards)
+
+        def for_players(values: List[np.ndarray]):
+            stacked = np.stack(values, axis=1)
+            return stacked[rows, current], stacked[rows, 1 - current]
+
+        # 1. Kontrola środka
+        center = [(piece * self.center_weights).sum(axis=(1, 2)) for piece in pieces]
+        center_cur, center_opp = for_players(center)
+        score = center_cur * 1.5 - center_opp * 1.5
+
+        # 2. i 4. Wzorce oraz zagrożenia - kody wszystkich okien naraz
+        flat = boards.reshape(n_boards, -1).astype(np.int32)
+        codes = (flat[:, self.line_cells] * self.powers).sum(axis=2)
+        patterns = [self.tables[player][codes].sum(axis=1) for player in [0, 1]]
+        threats = [self.tables[2 + player][codes].sum(axis=1) for player in [0, 1]]
+        pattern_cur, pattern_opp = for_players(patterns)
+        threat_cur, threat_opp = for_players(threats)
+        score += pattern_cur - pattern_opp * 1.1
+
+        # 3. Struktura - wysokość pionków i nierówności kolumn
+        heights = (boards != 0).sum(axis=1)
+        uneven_penalty = (np.abs(np.diff(heights, axis=1)) > 2).sum(axis=1) * 5
+        structure = [(piece * self.height_bonus[:, None]).sum(axis=(1, 2)) - uneven_penalty
+                     for piece in pieces]
+        structure_cur, structure_opp = for_players(structure)
+        score += structure_cur - structure_opp
+
+        score += threat_cur - threat_opp * 1.2
+
+        # 5. Mobilność (evaluate_mobility) nie zależy od gracza, więc jej składniki
+        # dla gracza na ruchu i przeciwnika znoszą się - nie trzeba jej liczyć
+
+        return score
+
+    def child_boards(self, parent: np.ndarray, moves: Sequence[int], heights: Sequence[int],
+                     player: int) -> np.ndarray:
+        """Zwraca pozycje po każdym z ruchów gracza z pozycji parent (bez kopiowania w pętli)."""
+        children = np.repeat(parent[None], len(moves), axis=0)
+        moves = np.asarray(moves, dtype=np.intp)
+        children[np.arange(len(moves)), np.asarray(heights, dtype=np.intp)[moves], moves] = player + 1
+        return children
+
+
+def verify_against_scalar(engine, games) -> float:
+    """
+    Porównuje ocenę wektorową z engine.evaluate_position_advanced dla listy plansz
+    (BitBoard z tablicami linii silnika). Zwraca największą bezwzględną różnicę.
+    """
+    first = games[0]
+    evaluator = BatchEvaluator(first.n_rows, first.n_columns, first.winning_length,
+                               engine.get_line_tables(first.winning_length))
+    batch_scores = evaluator.evaluate(np.stack([board_to_array(game) for game in games]))
+    scalar_scores = np.array([engine.evaluate_position_advanced(game) for game in games])
+    return float(np.max(np.abs(batch_scores - scalar_scores)))
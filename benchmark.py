@@ -0,0 +1,484 @@
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import daniel
+import test2
+from bitboard import BitBoard
+
+# Stały zestaw pozycji ze środkowej fazy gry na planszy 7x7 (historie ruchów)
+MIDGAME_POSITIONS_7X7 = [
+    [3, 3, 2, 4, 2, 2],
+    [3, 2, 4, 4, 3, 3, 1, 5],
+    [0, 6, 3, 3, 4, 2, 2],
+    [3, 4, 3, 4, 2, 1, 5],
+    [3, 3, 4, 2, 5, 6, 2, 4, 1],
+    [2, 3, 3, 4, 4, 4, 5, 1],
+]
+
+# Wersjonowany zestaw pozycji do śledzenia wydajności (--suite). Każda zmiana pozycji
+# albo głębokości wymaga podbicia SUITE_VERSION - wyniki różnych wersji nie są porównywane.
+SUITE_VERSION = 1
+SUITE_POSITIONS = {
+    (6, 7, 4): [
+        [4, 0, 3, 2, 4, 3, 4, 4],
+        [3, 2, 3, 3, 4, 4, 5, 6, 3, 4, 4, 6],
+        [2, 2, 3, 1, 4, 5, 4, 4, 4, 3, 5, 1],
+        [0, 4, 3, 4, 4, 3, 4, 1, 1, 5, 3, 3, 5, 5, 3, 1],
+    ],
+    (7, 7, 4): [
+        [3, 3, 2, 4, 2, 2],
+        [3, 2, 4, 4, 3, 3, 1, 5],
+        [0, 6, 3, 3, 4, 2, 2],
+        [3, 3, 4, 2, 5, 6, 2, 4, 1],
+    ],
+    (8, 8, 5): [
+        [0, 6, 4, 3, 4, 6, 6, 4, 6, 3],
+        [0, 6, 4, 3, 4, 6, 6, 4, 6, 3, 6, 6, 3, 3, 3, 5],
+        [7, 7, 4, 3, 3, 3, 3, 3, 3, 3, 5, 5, 5, 5, 5, 3],
+        [7, 7, 4, 3, 3, 3, 3, 3, 3, 3, 5, 5, 5, 5, 5, 3, 4, 7, 7, 4, 4, 4],
+    ],
+}
+# Głębokości przeszukiwania silników w zestawie
+SUITE_DEPTHS = {'UnbeatableAI': 10, 'daniel.Player': 8, 'SimpleAI': 5}
+
+# Liczba powtórzeń każdej pozycji - czas pozycji to najlepszy z pomiarów
+SUITE_REPEATS = 3
+
+# Domyślne progi regresji: liczba węzłów jest powtarzalna i sprawdzana zawsze, czas
+# (zaszumiony) - z luźniejszym progiem i tylko na tym samym środowisku co wynik odniesienia
+NODE_THRESHOLD = 0.10
+TIME_THRESHOLD = 0.50
+
+# Pola wyników opisujące środowisko - czasy z różnych środowisk nie są porównywalne
+ENVIRONMENT_FIELDS = ('python', 'platform', 'cpu_count')
+
+# Domyślne pliki wyników i wyniku odniesienia
+SUITE_OUTPUT = 'benchmark_results.json'
+SUITE_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks',
+                              'baseline.json')
+
+
+class CopyingPlayer(daniel.Player):
+    """Dawna wersja przeszukiwania (copy.deepcopy dla każdego węzła) - punkt odniesienia."""
+
+    def alpha_beta(self, game, depth: int, alpha: float, beta: float, maximizing_player: bool):
+        self.nodes_visited += 1
+        winner = game.check_winner()
+        if winner is not None:
+            return self.evaluate_terminal(game, winner), None
+        if depth == 0:
+            return self.evaluate_position(game), None
+        if game.is_full():
+            return 0, None
+
+        valid_moves = self.order_moves(game, self.get_valid_moves(game))
+        best_column = valid_moves[0]
+        best_eval = float('-inf') if maximizing_player else float('inf')
+        for col in valid_moves:
+            game_copy = copy.deepcopy(game)
+            game_copy.make_move(col)
+            eval_score, _ = self.alpha_beta(game_copy, depth - 1, alpha, beta, not maximizing_player)
+            if maximizing_player and eval_score > best_eval:
+                best_eval, best_column = eval_score, col
+                alpha = max(alpha, eval_score)
+            elif not maximizing_player and eval_score < best_eval:
+                best_eval, best_column = eval_score, col
+                beta = min(beta, eval_score)
+            if beta <= alpha:
+                break
+        return best_eval, best_column
+
+
+def build_position(board_class, history: List[int], n_rows: int = 7, n_columns: int = 7,
+                   winning_length: int = 4):
+    """Odtwarza pozycję z historii ruchów."""
+    game = board_class(n_rows, n_columns, winning_length)
+    for col in history:
+        game.make_move(col)
+    return game
+
+
+def run_daniel_search(player: daniel.Player, board_class, depth: int) -> Dict:
+    """Przeszukuje wszystkie pozycje zestawu i zwraca sumaryczne statystyki."""
+    total_nodes = 0
+    moves = []
+    start_time = time.perf_counter()
+    for history in MIDGAME_POSITIONS_7X7:
+        game = build_position(board_class, history)
+        if board_class is BitBoard:
+            # Tak jak w Player.make_move - plansza bitowa z sumami ocen okien
+            game = BitBoard.from_game(game, player.get_window_tables(game.winning_length))
+        player.nodes_visited = 0
+        _, move = player.alpha_beta(game, depth, float('-inf'), float('inf'), True)
+        total_nodes += player.nodes_visited
+        moves.append(move)
+    elapsed = time.perf_counter() - start_time
+    return {'nodes': total_nodes, 'time': elapsed, 'moves': moves,
+            'nps': total_nodes / max(elapsed, 1e-9)}
+
+
+def benchmark_daniel(depth: int):
+    """Porównuje przeszukiwanie z kopiowaniem i przeszukiwanie ruch/cofnięcie."""
+    variants = [
+        ("deepcopy / Game", CopyingPlayer(), daniel.Game),
+        ("make/undo / Game", daniel.Player(), daniel.Game),
+        ("make/undo / BitBoard", daniel.Player(), BitBoard),
+    ]
+
+    print(f"daniel.Player, głębokość {depth}, {len(MIDGAME_POSITIONS_7X7)} pozycji 7x7")
+    print(f"{'Wariant':<24} {'Węzły':>10} {'Czas [s]':>10} {'Węzłów/s':>10} {'Przysp.':>8}")
+    reference_time = None
+    for name, player, board_class in variants:
+        stats = run_daniel_search(player, board_class, depth)
+        if reference_time is None:
+            reference_time = stats['time']
+        speedup = reference_time / max(stats['time'], 1e-9)
+        print(f"{name:<24} {stats['nodes']:>10,} {stats['time']:>10.3f} "
+              f"{stats['nps']:>10,.0f} {speedup:>7.1f}x")
+
+
+def benchmark_unbeatable(max_depth: int, search_driver: str = 'aspiration'):
+    """Liczba węzłów UnbeatableAI na każdej ukończonej głębokości iterative deepening."""
+    print(f"UnbeatableAI ({search_driver}), iterative deepening do głębokości {max_depth}, "
+          f"{len(MIDGAME_POSITIONS_7X7)} pozycji 7x7")
+    totals = {}
+    start_time = time.perf_counter()
+    for history in MIDGAME_POSITIONS_7X7:
+        engine = test2.UnbeatableAI(max_depth=max_depth, time_limit=None,
+                                    search_driver=search_driver)
+        game = BitBoard.from_game(build_position(test2.Game, history),
+                                  engine.get_line_tables(4))
+        engine.reset_stats()
+        engine.transposition_table.new_search()
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.iterative_deepening(game, game.get_valid_moves()[0], time.time())
+        print(f"{str(history):<30} " + "  ".join(
+            f"d{depth}: {nodes:>7,} ({move})" for depth, nodes, _, _, move in engine.depth_stats))
+        for depth, nodes, _, _, _ in engine.depth_stats:
+            totals[depth] = totals.get(depth, 0) + nodes
+    elapsed = time.perf_counter() - start_time
+    print(f"{'Razem':<30} " + "  ".join(f"d{depth}: {nodes:>7,}    "
+                                         for depth, nodes in sorted(totals.items())))
+    print(f"Czas: {elapsed:.3f} s")
+
+
+def benchmark_smp(max_depth: int, worker_counts=(1, 2, 4, 8, 16)):
+    """
+    Krzywe przyspieszenia Lazy SMP: czas dojścia do każdej głębokości (najszybszy
+    proces) sumowany po pozycjach zestawu, dla różnej liczby procesów.
+    """
+    print(f"UnbeatableAI Lazy SMP, głębokość {max_depth}, {len(MIDGAME_POSITIONS_7X7)} pozycji 7x7 "
+          f"({os.cpu_count()} rdzeni)")
+    depths = list(range(4, max_depth + 1, 2))
+    print(f"{'Procesy':<8} " + " ".join(f"{'d' + str(depth) + ' [s]':>9}" for depth in depths)
+          + f" {'Węzły':>10} {'Przysp.':>8}")
+    reference_time = None
+    for workers in worker_counts:
+        engine = test2.UnbeatableAI(max_depth=max_depth, time_limit=None, workers=workers,
+                                    solver_threshold=None)
+        totals = dict.fromkeys(depths, 0.0)
+        nodes = 0
+        for history in MIDGAME_POSITIONS_7X7:
+            game = BitBoard.from_game(build_position(test2.Game, history),
+                                      engine.get_line_tables(4))
+            engine.reset_stats()
+            engine.transposition_table.clear()
+            engine.transposition_table.new_search()
+            with contextlib.redirect_stdout(io.StringIO()):
+                if workers > 1:
+                    engine.parallel_search(game, game.get_valid_moves()[0], time.time())
+                    times = engine.smp.time_to_depth()
+                else:
+                    engine.iterative_deepening(game, game.get_valid_moves()[0], time.time())
+                    times = {depth: elapsed for depth, _, elapsed, _, _ in engine.depth_stats}
+            nodes += engine.nodes_visited
+            for depth in depths:
+                totals[depth] += times.get(depth, float('nan'))
+        engine.close()
+
+        if reference_time is None:
+            reference_time = totals[depths[-1]]
+        speedup = reference_time / max(totals[depths[-1]], 1e-9)
+        print(f"{workers:<8} " + " ".join(f"{totals[depth]:>9.3f}" for depth in depths)
+              + f" {nodes:>10,} {speedup:>7.2f}x")
+
+
+def random_positions(engine: test2.UnbeatableAI, count: int, n_rows: int, n_columns: int,
+                     winning_length: int, seed: int = 0) -> List[BitBoard]:
+    """Losuje nieterminalne pozycje (BitBoard z tablicami linii silnika)."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        game = BitBoard(n_rows, n_columns, winning_length, engine.get_line_tables(winning_length))
+        for _ in range(rng.randrange(n_rows * n_columns)):
+            game.make_move(rng.choice(game.get_valid_moves()))
+            if game.check_winner() is not None or game.is_board_full():
+                game.undo_move()
+                break
+        positions.append(game)
+    return positions
+
+
+def benchmark_batch_eval(count: int = 2000):
+    """Porównuje ocenę skalarną i wektorową (NumPy) liści - zgodność i czas."""
+    from batch_eval import BatchEvaluator, board_to_array, verify_against_scalar
+    import numpy as np
+
+    engine = test2.UnbeatableAI()
+    print(f"Ocena {count} pozycji: evaluate_position_advanced vs BatchEvaluator")
+    print(f"{'Plansza':<10} {'Maks. różnica':>14} {'Skalarnie [s]':>14} {'NumPy [s]':>10}")
+    for n_rows, n_columns, winning_length in [(6, 7, 4), (7, 7, 4), (8, 8, 5)]:
+        positions = random_positions(engine, count, n_rows, n_columns, winning_length)
+        max_diff = verify_against_scalar(engine, positions)
+
+        start_time = time.perf_counter()
+        for game in positions:
+            engine.evaluate_position_advanced(game)
+        scalar_time = time.perf_counter() - start_time
+
+        evaluator = BatchEvaluator(n_rows, n_columns, winning_length,
+                                   engine.get_line_tables(winning_length))
+        boards = np.stack([board_to_array(game) for game in positions])
+        start_time = time.perf_counter()
+        evaluator.evaluate(boards)
+        batch_time = time.perf_counter() - start_time
+
+        print(f"{n_rows}x{n_columns}/{winning_length:<5} {max_diff:>14.2e} "
+              f"{scalar_time:>14.3f} {batch_time:>10.3f}")
+
+
+def config_name(config: Tuple[int, int, int]) -> str:
+    """Zapis konfiguracji planszy, np. 7x7/4."""
+    return f"{config[0]}x{config[1]}/{config[2]}"
+
+
+def search_suite_position(engine_name: str, config: Tuple[int, int, int],
+                          history: List[int]) -> Dict:
+    """
+    Przeszukuje jedną pozycję zestawu świeżo utworzonym silnikiem (bez księgi otwarć
+    i limitu czasu, więc liczba węzłów jest powtarzalna) i zwraca wynik pomiaru.
+    """
+    depth = SUITE_DEPTHS[engine_name]
+    time_to_depth, tt_hit_rate = {}, None
+    if engine_name == 'UnbeatableAI':
+        engine = test2.UnbeatableAI(max_depth=depth, time_limit=None, solver_threshold=None,
+                                    use_book=False)
+        game = BitBoard(*config, engine.get_line_tables(config[2]))
+        for col in history:
+            game.make_move(col)
+        engine.reset_stats()
+        engine.transposition_table.new_search()
+        start_time = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            move = engine.iterative_deepening(game, game.get_valid_moves()[0], time.time())
+        elapsed = time.perf_counter() - start_time
+        nodes = engine.nodes_visited
+        time_to_depth = {str(stats[0]): stats[2] for stats in engine.depth_stats}
+        tt_hit_rate = engine.transposition_table.hit_rate()
+    elif engine_name == 'daniel.Player':
+        player = daniel.Player()
+        game = BitBoard(*config, player.get_window_tables(config[2]))
+        for col in history:
+            game.make_move(col)
+        player.nodes_visited = 0
+        start_time = time.perf_counter()
+        _, move = player.alpha_beta(game, depth, float('-inf'), float('inf'), True)
+        elapsed = time.perf_counter() - start_time
+        nodes = player.nodes_visited
+    else:
+        engine = test2.SimpleAI(depth)
+        game = build_position(BitBoard, history, *config)
+        engine.nodes_visited = 0
+        start_time = time.perf_counter()
+        _, move = engine.minimax(game, depth, True)
+        elapsed = time.perf_counter() - start_time
+        nodes = engine.nodes_visited
+
+    if not time_to_depth:
+        time_to_depth = {str(depth): elapsed}
+    return {'engine': engine_name, 'config': config_name(config), 'history': history,
+            'depth': depth, 'nodes': nodes, 'time': elapsed,
+            'nps': nodes / max(elapsed, 1e-9), 'time_to_depth': time_to_depth,
+            'tt_hit_rate': tt_hit_rate, 'move': move}
+
+
+def run_suite(engines: Optional[List[str]] = None, repeats: int = SUITE_REPEATS) -> Dict:
+    """
+    Uruchamia zestaw SUITE_POSITIONS dla wybranych silników i zwraca wyniki (do JSON).
+    Każda pozycja jest przeszukiwana repeats razy - zapisywany jest najszybszy pomiar.
+    """
+    engines = engines or list(SUITE_DEPTHS)
+    print(f"Zestaw pozycji v{SUITE_VERSION}: " + ", ".join(
+        f"{config_name(config)} ({len(positions)})" for config, positions in SUITE_POSITIONS.items())
+        + f", najlepszy z {repeats} pomiarów")
+    print(f"{'Silnik':<15} {'Plansza':<8} {'Historia':<24} {'Węzły':>9} {'Czas [s]':>9} "
+          f"{'Węzłów/s':>9} {'TT':>6} {'Ruch':>5}")
+
+    results = []
+    totals = {}
+    for engine_name in engines:
+        for config, positions in SUITE_POSITIONS.items():
+            for history in positions:
+                result = min((search_suite_position(engine_name, config, history)
+                              for _ in range(repeats)), key=lambda run: run['time'])
+                results.append(result)
+                total = totals.setdefault(engine_name, {'nodes': 0, 'time': 0.0})
+                total['nodes'] += result['nodes']
+                total['time'] += result['time']
+
+                moves = ','.join(map(str, history))
+                if len(moves) > 23:
+                    moves = moves[:20] + '...'
+                hit_rate = ('-' if result['tt_hit_rate'] is None
+                            else f"{result['tt_hit_rate'] * 100:.0f}%")
+                print(f"{engine_name:<15} {result['config']:<8} {moves:<24} {result['nodes']:>9,} "
+                      f"{result['time']:>9.3f} {result['nps']:>9,.0f} {hit_rate:>6} "
+                      f"{str(result['move']):>5}")
+
+    for total in totals.values():
+        total['nps'] = total['nodes'] / max(total['time'], 1e-9)
+    return {'suite_version': SUITE_VERSION, 'depths': SUITE_DEPTHS, 'repeats': repeats,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0], 'platform': platform.platform(),
+            'cpu_count': os.cpu_count(), 'results': results, 'totals': totals}
+
+
+def compare_with_baseline(current: Dict, baseline: Dict, threshold: float = NODE_THRESHOLD,
+                          time_threshold: float = TIME_THRESHOLD) -> List[str]:
+    """
+    Porównuje wyniki z wynikiem odniesienia. Regresją jest wzrost liczby węzłów
+    pozycji o więcej niż threshold. Sumaryczny czas silnika (czas pojedynczych pozycji
+    jest zbyt zaszumiony) jest regresją przy wzroście o więcej niż time_threshold tylko
+    wtedy, gdy środowisko (ENVIRONMENT_FIELDS) jest takie samo jak w wyniku odniesienia
+    - w innym środowisku różnice czasu są jedynie ostrzeżeniami. Zmiany wybranego ruchu
+    są tylko wypisywane. Zwraca listę opisów regresji.
+    """
+    if baseline.get('suite_version') != current['suite_version']:
+        print(f"⚠️ Wynik odniesienia dotyczy zestawu v{baseline.get('suite_version')}, "
+              f"bieżący - v{current['suite_version']}; porównanie pominięte")
+        return []
+
+    regressions = []
+    reference = {(result['engine'], result['config'], tuple(result['history'])): result
+                 for result in baseline['results']}
+    for result in current['results']:
+        key = (result['engine'], result['config'], tuple(result['history']))
+        if key not in reference:
+            continue
+        old = reference[key]
+        position = f"{result['engine']} {result['config']} {result['history']}"
+        if result['nodes'] > old['nodes'] * (1 + threshold):
+            regressions.append(f"{position}: węzły {old['nodes']:,} -> {result['nodes']:,}")
+        if result['move'] != old['move']:
+            print(f"ℹ️ {position}: ruch {old['move']} -> {result['move']}")
+
+    same_environment = all(baseline.get(field) == current.get(field)
+                           for field in ENVIRONMENT_FIELDS)
+    print(f"\nPorównanie z wynikiem odniesienia ({baseline.get('created', '?')}, "
+          f"próg węzłów {threshold * 100:.0f}%, czasu {time_threshold * 100:.0f}%)")
+    if not same_environment:
+        print("⚠️ Inne środowisko niż w wyniku odniesienia (" + ", ".join(
+            f"{field}: {baseline.get(field)} -> {current.get(field)}"
+            for field in ENVIRONMENT_FIELDS if baseline.get(field) != current.get(field))
+            + ") - czas tylko informacyjnie")
+    print(f"{'Silnik':<15} {'Węzły':>9} {'Czas':>9} {'Węzłów/s':>9}")
+    for engine_name, total in current['totals'].items():
+        old = baseline['totals'].get(engine_name)
+        if old is None:
+            continue
+        ratios = [total[name] / max(old[name], 1e-9) for name in ('nodes', 'time', 'nps')]
+        print(f"{engine_name:<15} " + " ".join(f"{ratio:>8.2f}x" for ratio in ratios))
+        if total['time'] > old['time'] * (1 + time_threshold):
+            message = f"{engine_name}: łączny czas {old['time']:.3f} s -> {total['time']:.3f} s"
+            if same_environment:
+                regressions.append(message)
+            else:
+                print(f"⚠️ {message}")
+    return regressions
+
+
+def benchmark_suite(engines: Optional[List[str]], output: str, baseline_path: Optional[str],
+                    threshold: float, time_threshold: float, save_baseline: bool,
+                    repeats: int = SUITE_REPEATS) -> bool:
+    """
+    Uruchamia zestaw, zapisuje wyniki do pliku JSON i porównuje je z wynikiem
+    odniesienia (jeśli istnieje). Zwraca True, gdy nie wykryto regresji.
+    """
+    current = run_suite(engines, repeats)
+    with open(output, 'w') as results_file:
+        json.dump(current, results_file, indent=2)
+    print(f"\nWyniki zapisano w {output}")
+
+    if save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(baseline_path)), exist_ok=True)
+        with open(baseline_path, 'w') as baseline_file:
+            json.dump(current, baseline_file, indent=2)
+        print(f"Zapisano wynik odniesienia: {baseline_path}")
+        return True
+    if baseline_path is None or not os.path.exists(baseline_path):
+        print("Brak wyniku odniesienia - porównanie pominięte")
+        return True
+
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = compare_with_baseline(current, baseline, threshold, time_threshold)
+    if regressions:
+        print(f"\n❌ Regresje ({len(regressions)}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return False
+    print("\n✅ Brak regresji")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark silników Connect 4")
+    parser.add_argument("--depth", type=int, default=5, help="głębokość przeszukiwania")
+    parser.add_argument("--unbeatable", action="store_true",
+                        help="węzły UnbeatableAI na kolejnych głębokościach")
+    parser.add_argument("--smp", type=int, nargs="*", metavar="N",
+                        help="czas dojścia do głębokości dla N procesów Lazy SMP "
+                             "(domyślnie 1 2 4 8 16)")
+    parser.add_argument("--batch", action="store_true",
+                        help="porównaj ocenę skalarną z wektorową (wymaga NumPy)")
+    parser.add_argument("--suite", action="store_true",
+                        help="wersjonowany zestaw pozycji 6x7/4, 7x7/4 i 8x8/5 dla wszystkich "
+                             "silników - wyniki w JSON i porównanie z wynikiem odniesienia")
+    parser.add_argument("--engines", nargs="+", choices=list(SUITE_DEPTHS),
+                        help="silniki zestawu (domyślnie wszystkie)")
+    parser.add_argument("--output", default=SUITE_OUTPUT, help="plik wyników zestawu (JSON)")
+    parser.add_argument("--baseline", default=SUITE_BASELINE, help="plik wyniku odniesienia")
+    parser.add_argument("--threshold", type=float, default=NODE_THRESHOLD,
+                        help="względny wzrost liczby węzłów uznawany za regresję")
+    parser.add_argument("--time-threshold", type=float, default=TIME_THRESHOLD,
+                        help="względny wzrost łącznego czasu silnika uznawany za regresję "
+                             "(tylko w tym samym środowisku co wynik odniesienia)")
+    parser.add_argument("--repeats", type=int, default=SUITE_REPEATS,
+                        help="liczba pomiarów każdej pozycji (zapisywany najszybszy)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="zapisz wyniki zestawu jako nowy wynik odniesienia")
+    args = parser.parse_args()
+
+    if args.suite:
+        passed = benchmark_suite(args.engines, args.output, args.baseline, args.threshold,
+                                 args.time_threshold, args.save_baseline, args.repeats)
+        sys.exit(0 if passed else 1)
+    elif args.batch:
+        benchmark_batch_eval()
+    elif args.smp is not None:
+        benchmark_smp(args.depth, args.smp or (1, 2, 4, 8, 16))
+    elif args.unbeatable:
+        for search_driver in test2.UnbeatableAI.SEARCH_DRIVERS:
+            benchmark_unbeatable(args.depth, search_driver)
+            print()
+    else:
+        benchmark_daniel(args.depth)
@@ -0,0 +1,377 @@
+from typing import List, Optional, Tuple
+
+from lines import get_line_index
+from patterns import WINDOW_POWERS
+from zobrist import get_move_keys, get_zobrist_keys
+
+
+class BitBoard:
+    """
+    Plansza oparta na maskach bitowych - szybki rdzeń dla silników przeszukujących.
+
+    Każda kolumna zajmuje n_rows + 1 bitów: n_rows pól planszy oraz jeden bit
+    strażnika nad kolumną, dzięki któremu przesunięcia bitowe nie "przeskakują"
+    między kolumnami. Pole (col, row) odpowiada bitowi col * (n_rows + 1) + row.
+
+    current_position :
+        maska pionków gracza, który ma teraz ruch
+    mask :
+        maska wszystkich zajętych pól
+    heights :
+        liczba pionków w każdej kolumnie
+    hash :
+        klucz Zobrista pozycji (pola obu graczy + gracz na ruchu), aktualizowany
+        przyrostowo w make_move / undo_move
+    mirror_hash :
+        klucz Zobrista odbicia lustrzanego pozycji (kolumna col <-> n_columns - 1 - col),
+        aktualizowany razem z hash; mniejszy z nich to klucz kanoniczny (canonical_hash)
+    line_states :
+        kod trójkowy każdej linii wygrywającej (patterns.encode_window) - tylko gdy
+        podano line_tables, czyli tablice ocen indeksowane kodem okna
+    line_totals :
+        sumy line_tables[k][line_states[line]] po wszystkich liniach, aktualizowane
+        przyrostowo - silnik odczytuje z nich składniki oceny zamiast skanować planszę
+
+    Interfejs (current_player, move_history, make_move, undo_move, check_winner, ...)
+    jest zgodny z klasą Game, więc silniki mogą działać na obu reprezentacjach.
+    Plansza nie ma listy list pionków - `board` jest odtwarzane z masek na żądanie
+    (wyświetlanie, weryfikacja), a przeszukiwanie korzysta wyłącznie z masek i heights.
+    """
+    n_rows: int
+    n_columns: int
+    winning_length: int
+    current_position: int
+    mask: int
+    heights: List[int]
+    hash: int
+    mirror_hash: int
+    move_history: List[int]
+    current_player: int
+
+    def __init__(self, n_rows: int = 7, n_columns: int = 7, winning_length: int = 4,
+                 line_tables: Optional[List[List[float]]] = None):
+        self.n_rows = n_rows
+        self.n_columns = n_columns
+        self.winning_length = winning_length
+        self.current_player = 0
+        self.current_position = 0
+        self.mask = 0
+        self.heights = [0] * n_columns
+        self.hash = 0
+        self.mirror_hash = 0
+        self.move_history = []
+
+        # Wysokość kolumny w bitach (z bitem strażnika)
+        self.column_height = n_rows + 1
+        self.bottom_masks = [1 << (col * self.column_height) for col in range(n_columns)]
+        self.board_mask = sum(((1 << n_rows) - 1) << (col * self.column_height)
+                              for col in range(n_columns))
+
+        # Przesunięcia dla kierunków: pionowo, poziomo, ukośnie / i ukośnie \
+        directions = (1, self.column_height, self.column_height - 1, self.column_height + 1)
+        # Linie sprawdzane przez podwajanie: maska początków ciągów r pionków
+        # AND przesunięta o k <= r pól daje początki ciągów r + k - dla długości 4
+        # wystarczą dwa przesunięcia na kierunek zamiast trzech
+        self.align_shifts = []
+        for shift in directions:
+            shifts = []
+            run = 1
+            while run < winning_length:
+                step = min(run, winning_length - run)
+                shifts.append(step * shift)
+                run += step
+            self.align_shifts.append(shifts)
+
+        # Dla winning_positions: przesunięcia pozostałych pól linii względem pustego pola
+        # na pozycji hole (ujemne = pola "przed" dziurą). Przesunięcia tworzą ciągły
+        # przedział wokół dziury, więc linia wychodząca poza planszę zawsze trafia
+        # najpierw na bit strażnika albo poza zakres maski - i daje zero.
+        self.bottom_mask = sum(self.bottom_masks)
+
+        # Kolumny lewej połowy ze środkową - wystarczają w pozycji symetrycznej
+        self.left_half_mask = sum(((1 << n_rows) - 1) << (col * self.column_height)
+                                  for col in range(n_columns) if col <= n_columns - 1 - col)
+        self.hole_shifts = [[k * shift for k in range(-hole, winning_length - hole) if k != 0]
+                            for shift in directions for hole in range(winning_length)]
+
+        self.zobrist_cells, self.zobrist_side = get_zobrist_keys(n_rows, n_columns)
+        self.move_keys = get_move_keys(n_rows, n_columns)
+        self.line_index = get_line_index(n_rows, n_columns, winning_length)
+
+        self.line_tables = line_tables
+        if line_tables is not None:
+            self.init_line_tracking()
+
+    def init_line_tracking(self):
+        """Przygotowuje liczniki linii na podstawie współdzielonego indeksu linii."""
+        n_lines = len(self.line_index)
+        self.line_states = [0] * n_lines
+        self.line_totals = [table[0] * n_lines for table in self.line_tables]
+
+        # Pionek gracza p na pozycji i linii zmienia jej kod o (p + 1) * 3 ** i
+        self.cell_lines = [[tuple((line, WINDOW_POWERS[position]) for line, position in entries)
+                            for entries in column]
+                           for column in self.line_index.cell_lines]
+
+    def update_lines(self, column: int, row: int, player: int, sign: int):
+        """Aktualizuje stany linii przechodzących przez pole oraz sumy line_totals."""
+        states = self.line_states
+        totals = self.line_totals
+        tables = self.line_tables
+        digit = sign * (player + 1)
+        for line, weight in self.cell_lines[column][row]:
+            old_state = states[line]
+            new_state = old_state + digit * weight
+            states[line] = new_state
+            for k, table in enumerate(tables):
+                totals[k] += table[new_state] - table[old_state]
+
+    @classmethod
+    def from_game(cls, game, line_tables: Optional[List[List[float]]] = None) -> 'BitBoard':
+        """Tworzy planszę bitową odtwarzając historię ruchów z obiektu Game."""
+        bitboard = cls(game.n_rows, game.n_columns, game.winning_length, line_tables)
+        for col in game.move_history:
+            bitboard.make_move(col)
+        return bitboard
+
+    def copy(self) -> 'BitBoard':
+        """Zwraca niezależną kopię planszy."""
+        return BitBoard.from_game(self, self.line_tables)
+
+    def can_play(self, column: int) -> bool:
+        """Sprawdza czy w kolumnie jest miejsce."""
+        return 0 <= column < self.n_columns and self.heights[column] < self.n_rows
+
+    def make_move(self, column: int) -> bool:
+        """Wykonuje ruch w danej kolumnie. Zwraca True jeśli ruch jest prawidłowy."""
+        if not 0 <= column < self.n_columns:
+            return False
+        heights = self.heights
+        row = heights[column]
+        if row >= self.n_rows:
+            return False
+
+        player = self.current_player
+        key, mirror_key = self.move_keys[player][column][row]
+        self.hash ^= key
+        self.mirror_hash ^= mirror_key
+
+        # Po ruchu maska "gracza na ruchu" należy do przeciwnika
+        mask = self.mask
+        self.current_position ^= mask
+        self.mask = mask | (mask + self.bottom_masks[column])
+        heights[column] = row + 1
+        if self.line_tables is not None:
+            self.update_lines(column, row, player, 1)
+
+        self.move_history.append(column)
+        self.current_player = 1 - player
+        return True
+
+    def undo_move(self, column: Optional[int] = None):
+        """Cofa ostatni ruch (kolumna jest opcjonalna - zgodność z Game.undo_move)."""
+        if not self.move_history:
+            return
+        column = self.move_history.pop()
+
+        heights = self.heights
+        row = heights[column] - 1
+        heights[column] = row
+        self.mask ^= 1 << (column * self.column_height + row)
+        self.current_position ^= self.mask
+
+        player = 1 - self.current_player
+        self.current_player = player
+        if self.line_tables is not None:
+            self.update_lines(column, row, player, -1)
+        key, mirror_key = self.move_keys[player][column][row]
+        self.hash ^= key
+        self.mirror_hash ^= mirror_key
+
+    def undo_to(self, moves: int):
+        """
+        Cofa ruchy, aż na planszy zostanie moves pionków - powrót do korzenia po
+        przerwaniu przeszukiwania w środku drzewa (wyjątek pomija cofnięcia ruchów).
+        """
+        while len(self.move_history) > moves:
+            self.undo_move()
+
+    def canonical_hash(self) -> Tuple[int, bool]:
+        """
+        Klucz pozycji wspólny dla niej i jej odbicia lustrzanego: (klucz, czy_odbita).
+        Gdy czy_odbita jest True, ruchy zapisywane pod kluczem trzeba odbijać
+        (mirror_column) - są w układzie odbitej pozycji.
+        """
+        if self.mirror_hash < self.hash:
+            return self.mirror_hash, True
+        return self.hash, False
+
+    def mirror_column(self, column: int) -> int:
+        """Kolumna odpowiadająca column w odbiciu lustrzanym planszy."""
+        return self.n_columns - 1 - column
+
+    def is_symmetric(self) -> bool:
+        """Sprawdza czy pozycja jest symetryczna względem środka planszy."""
+        return (self.hash == self.mirror_hash
+                and self.mirror_mask(self.mask) == self.mask
+                and self.mirror_mask(self.current_position) == self.current_position)
+
+    def mirror_mask(self, position: int) -> int:
+        """Maska position odbita lustrzanie (kolumna col <-> n_columns - 1 - col)."""
+        column_bits = (1 << self.column_height) - 1
+        last = self.n_columns - 1
+        result = 0
+        for col in range(self.n_columns):
+            result |= ((position >> (col * self.column_height)) & column_bits) \
+                << ((last - col) * self.column_height)
+        return result
+
+    @property
+    def board(self) -> List[List[int]]:
+        """
+        Lista list pionków (board[col][row] to numer gracza, od dołu) odtworzona z masek
+        - do wyświetlania i weryfikacji, nie do przeszukiwania (kosztuje O(pól)).
+        """
+        first = self.player_mask(0)
+        return [[0 if first >> (col * self.column_height + row) & 1 else 1
+                 for row in range(self.heights[col])]
+                for col in range(self.n_columns)]
+
+    def count_pieces(self, position: int, area: int) -> int:
+        """Liczba pionków maski position na polach maski area."""
+        return bin(position & area).count('1')
+
+    def has_piece(self, position: int, column: int, row: int) -> bool:
+        """Sprawdza czy pole (column, row) leży na planszy i należy do maski position."""
+        return (0 <= column < self.n_columns and 0 <= row < self.n_rows
+                and position >> (column * self.column_height + row) & 1 == 1)
+
+    def player_mask(self, player: int) -> int:
+        """Zwraca maskę pionków danego gracza."""
+        if player == self.current_player:
+            return self.current_position
+        return self.current_position ^ self.mask
+
+    def has_alignment(self, position: int) -> bool:
+        """Sprawdza czy maska zawiera winning_length pionków w jednej linii."""
+        for shifts in self.align_shifts:
+            line = position
+            for shift in shifts:
+                line &= line >> shift
+            if line:
+                return True
+        return False
+
+    def winning_positions(self, position: int, mask: int) -> int:
+        """
+        Zwraca maskę pustych pól (względem mask), których zajęcie przez właściciela
+        position tworzy linię winning_length pionków - także pól jeszcze niegrywalnych.
+        """
+        result = 0
+        for shifts in self.hole_shifts:
+            cells = self.board_mask
+            for shift in shifts:
+                cells &= position >> shift if shift > 0 else position << -shift
+                if not cells:
+                    break
+            result |= cells
+        return result & self.board_mask & ~mask
+
+    def open_lines(self, player: int) -> int:
+        """
+        Liczba linii wygrywających bez pionka przeciwnika gracza - tych, które gracz
+        może jeszcze ułożyć. Liczone z masek: wolne (dla gracza) pola kolejno
+        przesuwane wzdłuż kierunku (przez podwajanie), jak w has_alignment.
+        """
+        available = self.board_mask & ~self.player_mask(1 - player)
+        count = 0
+        for shifts in self.align_shifts:
+            line = available
+            for shift in shifts:
+                line &= line >> shift
+            count += bin(line).count('1')
+        return count
+
+    def has_open_line(self, player: int) -> bool:
+        """Sprawdza czy gracz ma jeszcze choć jedną otwartą linię (open_lines > 0, bez liczenia)."""
+        return self.has_alignment(self.board_mask & ~self.player_mask(1 - player))
+
+    def is_dead_draw(self) -> bool:
+        """Sprawdza czy żaden gracz nie może już ułożyć linii - remis niezależnie od dalszej gry."""
+        # Kolumna z co najmniej winning_length wolnymi polami to pionowa linia otwarta dla obu
+        if min(self.heights) <= self.n_rows - self.winning_length:
+            return False
+        return not (self.has_open_line(self.current_player)
+                    or self.has_open_line(1 - self.current_player))
+
+    def possible_moves(self, mask: int) -> int:
+        """Zwraca maskę pól, na które można teraz postawić pionek (najniższe wolne w kolumnach)."""
+        return (mask + self.bottom_mask) & self.board_mask
+
+    def winning_moves(self) -> int:
+        """Maska ruchów, którymi gracz na ruchu natychmiast wygrywa."""
+        return self.winning_positions(self.current_position, self.mask) & self.possible_moves(self.mask)
+
+    def non_losing_moves(self) -> int:
+        """
+        Maska ruchów, po których przeciwnik nie wygrywa od razu (zakłada, że gracz na
+        ruchu sam nie ma wygrywającego ruchu). Jeśli przeciwnik ma zagrożenie, jedynym
+        kandydatem jest jego blokada; dwa zagrożenia naraz albo brak bezpiecznego ruchu
+        dają 0, czyli pozycję przegraną. Ruchy pod polem wygrywającym przeciwnika
+        są odrzucane.
+        """
+        possible = self.possible_moves(self.mask)
+        opponent_win = self.winning_positions(self.current_position ^ self.mask, self.mask)
+        forced = possible & opponent_win
+        if forced:
+            if forced & (forced - 1):
+                return 0
+            possible = forced
+        return possible & ~(opponent_win >> 1)
+
+    def column_mask(self, column: int) -> int:
+        """Maska wszystkich pól kolumny."""
+        return ((1 << self.n_rows) - 1) << (column * self.column_height)
+
+    def move_columns(self, moves: int) -> List[int]:
+        """Zamienia maskę ruchów (po jednym polu w kolumnie) na listę kolumn."""
+        columns = []
+        while moves:
+            bit = moves & -moves
+            moves ^= bit
+            columns.append((bit.bit_length() - 1) // self.column_height)
+        return columns
+
+    def is_winning_move(self, column: int, player: Optional[int] = None) -> bool:
+        """Sprawdza czy postawienie pionka gracza (domyślnie gracza na ruchu) w kolumnie wygrywa."""
+        if not self.can_play(column):
+            return False
+        if player is None:
+            player = self.current_player
+        move_bit = 1 << (column * self.column_height + self.heights[column])
+        return self.has_alignment(self.player_mask(player) | move_bit)
+
+    def check_winner(self) -> Optional[int]:
+        """Sprawdza czy ostatni ruch dał zwycięstwo. Zwraca 0 lub 1, albo None."""
+        if not self.move_history:
+            return None
+        last_player = 1 - self.current_player
+        if self.has_alignment(self.current_position ^ self.mask):
+            return last_player
+        return None
+
+    def is_board_full(self) -> bool:
+        """Sprawdza czy plansza jest pełna."""
+        return len(self.move_history) >= self.n_rows * self.n_columns
+
+    def is_full(self) -> bool:
+        """Alias zgodny z daniel.Game."""
+        return self.is_board_full()
+
+    def is_terminal(self) -> bool:
+        """Sprawdza czy gra się skończyła."""
+        return self.check_winner() is not None or self.is_board_full()
+
+    def get_valid_moves(self) -> List[int]:
+        """Zwraca listę dostępnych kolumn."""
+        return [col for col in range(self.n_columns) if self.heights[col] < self.n_rows]
@@ -0,0 +1,224 @@
+import contextlib
+import io
+import mmap
+import os
+import struct
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from bitboard import BitBoard
+
+# Katalog z plikami ksiąg otwarć (book_<wiersze>x<kolumny>_<długość>.bin)
+BOOK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'books')
+
+# Nagłówek: sygnatura, wersja formatu, geometria, liczba półruchów, głębokość
+# przeszukiwania pozycji, liczba rekordów
+BOOK_MAGIC = b'C4BK'
+BOOK_VERSION = 2
+HEADER = struct.Struct('<4sBBBBBBxxI')
+
+# Rekord: kanoniczny klucz Zobrista pozycji, wynik przeszukiwania, ruch (w układzie
+# pozycji kanonicznej). Rekordy są posortowane rosnąco po kluczu.
+RECORD = struct.Struct('<QhB')
+KEY = struct.Struct('<Q')
+
+# Konfiguracje plansz rozgrywane w turnieju (wiersze, kolumny, długość linii)
+BOOK_CONFIGS = [(6, 7, 4), (7, 7, 4), (8, 8, 5)]
+
+
+def book_path(n_rows: int, n_columns: int, winning_length: int,
+              directory: str = BOOK_DIR) -> str:
+    """Ścieżka pliku księgi otwarć dla danej geometrii."""
+    return os.path.join(directory, f"book_{n_rows}x{n_columns}_{winning_length}.bin")
+
+
+class OpeningBook:
+    """
+    Księga otwarć czytana z pliku przez mmap - bez wczytywania do słownika.
+
+    Plik to nagłówek (HEADER) i posortowane po kluczu rekordy (RECORD). Pozycja jest
+    szukana binarnie po kanonicznym kluczu Zobrista (BitBoard.canonical_hash), więc
+    pozycja i jej odbicie lustrzane mają wspólny wpis; ruch jest odbijany przy odczycie.
+    Otwarcie pliku kosztuje tyle co mmap, a zapytanie - kilkanaście odczytów struct.
+
+    depth to głębokość, do której przeszukano pozycje przy budowie księgi - silnik
+    przeszukujący głębiej nie gra ruchów z księgi wprost (byłyby słabsze od jego własnych),
+    tylko przeszukuje je w korzeniu jako pierwsze (UnbeatableAI.root_hint).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as book_file:
+            self.data = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, n_rows, n_columns, winning_length, plies, depth, count = \
+            HEADER.unpack_from(self.data, 0)
+        if magic != BOOK_MAGIC or version != BOOK_VERSION:
+            self.data.close()
+            raise ValueError(f"Nieprawidłowy plik księgi otwarć: {path}")
+        if HEADER.size + count * RECORD.size > len(self.data):
+            self.data.close()
+            raise ValueError(f"Uszkodzony plik księgi otwarć: {path}")
+        self.geometry = (n_rows, n_columns, winning_length)
+        self.plies = plies
+        self.depth = depth
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def find(self, key: int) -> Optional[Tuple[int, int]]:
+        """Wyszukuje binarnie klucz - zwraca (wynik, ruch kanoniczny) albo None."""
+        data = self.data
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            middle_key = KEY.unpack_from(data, HEADER.size + middle * RECORD.size)[0]
+            if middle_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count:
+            record_key, score, move = RECORD.unpack_from(data, HEADER.size + low * RECORD.size)
+            if record_key == key:
+                return score, move
+        return None
+
+    def probe(self, board: BitBoard) -> Optional[Tuple[int, int]]:
+        """
+        Zwraca (kolumna, wynik) z księgi dla pozycji planszy albo None. Wynik jest z
+        perspektywy gracza na ruchu (w skali oceny UnbeatableAI).
+        """
+        if len(board.move_history) > self.plies:
+            return None
+        if (board.n_rows, board.n_columns, board.winning_length) != self.geometry:
+            return None
+        key, mirrored = board.canonical_hash()
+        entry = self.find(key)
+        if entry is None:
+            return None
+        score, move = entry
+        if mirrored:
+            move = board.mirror_column(move)
+        if not board.can_play(move):
+            return None
+        return move, score
+
+    def close(self):
+        """Zamyka mapowanie pliku."""
+        self.data.close()
+
+
+@lru_cache(maxsize=None)
+def open_book(n_rows: int, n_columns: int, winning_length: int,
+              directory: str = BOOK_DIR) -> Optional[OpeningBook]:
+    """Zwraca (otwieraną raz na proces) księgę dla geometrii albo None, jeśli nie ma pliku."""
+    path = book_path(n_rows, n_columns, winning_length, directory)
+    if not os.path.exists(path):
+        return None
+    return OpeningBook(path)
+
+
+def book_positions(n_rows: int, n_columns: int, winning_length: int,
+                   plies: int) -> List[List[int]]:
+    """
+    Wszystkie nieterminalne pozycje do plies półruchów (historie ruchów), po jednej
+    z każdej pary pozycja / odbicie lustrzane - w kolejności rosnącej liczby pionków.
+    """
+    positions = []
+    seen = set()
+    layer = [[]]
+    for ply in range(plies + 1):
+        next_layer = []
+        for history in layer:
+            board = BitBoard(n_rows, n_columns, winning_length)
+            for col in history:
+                board.make_move(col)
+            key = board.canonical_hash()[0]
+            if key in seen or board.is_terminal():
+                continue
+            seen.add(key)
+            positions.append(history)
+            if ply < plies:
+                next_layer.extend(history + [col] for col in board.get_valid_moves())
+        layer = next_layer
+    return positions
+
+
+def build_book(n_rows: int, n_columns: int, winning_length: int, plies: int, depth: int,
+               path: Optional[str] = None, verbose: bool = True) -> int:
+    """
+    Przeszukuje UnbeatableAI (iterative deepening do depth, bez limitu czasu) każdą
+    pozycję do plies półruchów i zapisuje posortowany plik księgi. Zwraca liczbę
+    zapisanych rekordów.
+    """
+    from test2 import UnbeatableAI
+
+    if path is None:
+        path = book_path(n_rows, n_columns, winning_length)
+    engine = UnbeatableAI(max_depth=depth, time_limit=None, use_book=False)
+    positions = book_positions(n_rows, n_columns, winning_length, plies)
+
+    records: Dict[int, Tuple[int, int]] = {}
+    start_time = time.time()
+    for index, history in enumerate(positions):
+        board = BitBoard(n_rows, n_columns, winning_length, engine.get_line_tables(winning_length))
+        for col in history:
+            board.make_move(col)
+
+        engine.reset_stats()
+        engine.transposition_table.new_search()
+        with contextlib.redirect_stdout(io.StringIO()):
+            move = engine.iterative_deepening(board, board.get_valid_moves()[0], time.time())
+        score = engine.depth_stats[-1][3] if engine.depth_stats else 0
+
+        key, mirrored = board.canonical_hash()
+        if mirrored:
+            move = board.mirror_column(move)
+        records[key] = (max(-32768, min(32767, int(round(score)))), move)
+        if verbose:
+            print(f"\r{n_rows}x{n_columns}/{winning_length}: {index + 1}/{len(positions)} "
+                  f"pozycji, {time.time() - start_time:.0f} s", end='', flush=True)
+    if verbose:
+        print()
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as book_file:
+        book_file.write(HEADER.pack(BOOK_MAGIC, BOOK_VERSION, n_rows, n_columns, winning_length,
+                                    plies, depth, len(records)))
+        for key in sorted(records):
+            score, move = records[key]
+            book_file.write(RECORD.pack(key, score, move))
+    open_book.cache_clear()
+    return len(records)
+
+
+def parse_config(text: str) -> Tuple[int, int, int]:
+    """Parsuje konfigurację w postaci WIERSZExKOLUMNY/DŁUGOŚĆ, np. 7x7/4."""
+    size, winning_length = text.split('/')
+    n_rows, n_columns = size.split('x')
+    return int(n_rows), int(n_columns), int(winning_length)
+
+
+def main():
+    """Wiersz poleceń budowy ksiąg (argparse importowany dopiero tutaj - silniki importują book)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Budowa ksiąg otwarć Connect 4")
+    parser.add_argument("--plies", type=int, default=4,
+                        help="liczba półruchów od początku gry objętych księgą")
+    parser.add_argument("--depth", type=int, default=8, help="głębokość przeszukiwania pozycji")
+    parser.add_argument("--config", type=parse_config, action="append", metavar="RxC/W",
+                        help="konfiguracja planszy (domyślnie 6x7/4, 7x7/4 i 8x8/5)")
+    parser.add_argument("--output-dir", default=BOOK_DIR, help="katalog plików ksiąg")
+    args = parser.parse_args()
+
+    for config in args.config or BOOK_CONFIGS:
+        count = build_book(*config, args.plies, args.depth,
+                           book_path(*config, directory=args.output_dir))
+        print(f"Zapisano {count} pozycji: {book_path(*config, directory=args.output_dir)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 import random
-import copy
+
+from bitboard import BitBoard
+from book import open_book
+from lines import get_line_index
+from patterns import WINDOW_POWERS, build_window_table
 
 class Game:
     """
@@ -32,6 +36,9 @@ class Game:
     move_history : 
         historia ruchów od początku rozgrywki, w postaci listy kolumn, w których kolejno były umieszczane symbole. Np plansza z przykładu wyżej mogłaby odpowiadać następującej wartości zmiennej move_history : [0,3,1,1,0,1]
 
+    validate :
+        tryb walidacji. check_winner sprawdza tylko linie przechodzące przez ostatnio postawiony symbol; gdy validate jest True, wynik jest dodatkowo porównywany z pełnym skanem planszy (check_winner_full) i rozbieżność zgłaszana jest wyjątkiem AssertionError.
+
     """
     n_rows: int
     n_columns: int
@@ -39,11 +46,13 @@ class Game:
     board: list[list[int]]
     move_history: list[int]
     current_player: int
+    validate: bool
 
-    def __init__(self, n_rows : int = 7, n_columns : int = 7, winning_length : int = 4):
+    def __init__(self, n_rows : int = 7, n_columns : int = 7, winning_length : int = 4, validate : bool = False):
         self.n_rows = n_rows
         self.n_columns = n_columns
         self.winning_length = winning_length
+        self.validate = validate
         self.current_player = 0
         self.board = [[] for _ in range(self.n_columns)]
         self.move_history = []
@@ -92,13 +101,77 @@ class Game:
         
         return True
     
+    def undo_move(self, column: int = None):
+        """Cofa ostatni ruch - pozwala przeszukiwać bez kopiowania planszy."""
+        if not self.move_history:
+            return
+        column = self.move_history.pop()
+        self.board[column].pop()
+        self.current_player = 1 - self.current_player
+    
+    def can_play(self, column: int) -> bool:
+        """Sprawdza czy w kolumnie jest miejsce."""
+        return 0 <= column < self.n_columns and len(self.board[column]) < self.n_rows
+
+    def is_winning_move(self, column: int, player: int = None) -> bool:
+        """Sprawdza czy postawienie pionka gracza (domyślnie gracza na ruchu) w kolumnie wygrywa."""
+        if not self.can_play(column):
+            return False
+        if player is None:
+            player = self.current_player
+        
+        row = len(self.board[column])
+        self.board[column].append(player)
+        wins = self.check_winner_from_position(column, row, player) == player
+        self.board[column].pop()
+        return wins
+
     def is_full(self) -> bool:
         """Sprawdza czy plansza jest pełna."""
         return all(len(col) >= self.n_rows for col in self.board)
     
     def check_winner(self) -> int:
         """
-        Sprawdza czy ktoś wygrał grę.
+        Sprawdza czy ktoś wygrał grę. Wygrać mógł tylko gracz, który wykonał ostatni ruch,
+        więc wystarczy sprawdzić linie przechodzące przez ostatnio postawiony symbol.
+        
+        Returns:
+            0 lub 1 jeśli gracz wygrał, None jeśli nikt nie wygrał
+        """
+        if not self.move_history:
+            winner = None
+        else:
+            col = self.move_history[-1]
+            row = len(self.board[col]) - 1
+            winner = self.check_winner_from_position(col, row, self.board[col][row])
+        
+        if self.validate:
+            full_scan_winner = self.check_winner_full()
+            if winner != full_scan_winner:
+                raise AssertionError(f"check_winner: {winner}, pełny skan: {full_scan_winner}, "
+                                     f"historia ruchów: {self.move_history}")
+        
+        return winner
+
+    def check_winner_from_position(self, col: int, row: int, player: int) -> int:
+        """Sprawdza linie przechodzące przez pole (col, row). Zwraca player albo None."""
+        for d_col, d_row in ((1, 0), (0, 1), (1, 1), (1, -1)):
+            count = 1
+            for sign in (1, -1):
+                for i in range(1, self.winning_length):
+                    c = col + sign * i * d_col
+                    r = row + sign * i * d_row
+                    if not (0 <= c < self.n_columns and 0 <= r < len(self.board[c]) and
+                            self.board[c][r] == player):
+                        break
+                    count += 1
+            if count >= self.winning_length:
+                return player
+        return None
+
+    def check_winner_full(self) -> int:
+        """
+        Sprawdza czy ktoś wygrał grę skanując całą planszę (tryb walidacji).
         
         Returns:
             0 lub 1 jeśli gracz wygrał, None jeśli nikt nie wygrał
@@ -189,8 +262,15 @@ class Player:
         self.team_name = "Unbeatable AI"
         self.team_members = ["Kacper Daniel", "Paweł Karwecki", "Tadeusz Jagniewski"]
         self.max_depth = 8
+        self.nodes_visited = 0
         self.player_id = player_id  # ID gracza AI (0 lub 1)
         
+        # Czy przeszukiwać na planszy bitowej (BitBoard) zamiast na listach
+        self.use_bitboard = True
+        
+        # Tablice ocen okien (kod trójkowy okna -> ocena) dla każdej długości wygrywającej
+        self.window_tables = {}
+        
         # Tablica otwarć - klucz to tuple z historii ruchów, wartość to najlepszy ruch
         self.opening_book = self._initialize_opening_book()
         
@@ -242,6 +322,15 @@ class Player:
 
     def get_opening_move(self, game: Game) -> int:
         """Sprawdza czy istnieje ruch w tablicy otwarć dla aktualnej pozycji."""
+        # Księga otwarć z pliku (book.py) ma pierwszeństwo przed tablicą w kodzie - o ile
+        # jej pozycje przeszukano co najmniej do max_depth
+        book = open_book(game.n_rows, game.n_columns, game.winning_length)
+        if book is not None and book.depth >= self.max_depth:
+            board = game if isinstance(game, BitBoard) else BitBoard.from_game(game)
+            entry = book.probe(board)
+            if entry is not None:
+                return entry[0]
+        
         # Sprawdź tylko jeśli historia nie jest zbyt długa
         if len(game.move_history) > self.max_opening_depth:
             return None
@@ -255,8 +344,8 @@ class Player:
                 return suggested_move
         
         # Sprawdź również wzorce symetryczne (odbicie lustrzane)
-        # Dla planszy 7x7, kolumny mapują się: 0<->6, 1<->5, 2<->4, 3->3
-        symmetric_history = self.get_symmetric_history(game.move_history)
+        # Kolumny mapują się col <-> n_columns - 1 - col (dla 7 kolumn: 0<->6, 1<->5, 2<->4, 3->3)
+        symmetric_history = self.get_symmetric_history(game.move_history, game.n_columns)
         symmetric_tuple = tuple(symmetric_history)
         
         if symmetric_tuple in self.opening_book:
@@ -268,9 +357,9 @@ class Player:
         
         return None
 
-    def get_symmetric_history(self, history: list) -> list:
+    def get_symmetric_history(self, history: list, n_columns: int = 7) -> list:
         """Zwraca symetryczne odbicie historii ruchów."""
-        return [6 - move for move in history]  # Dla planszy 7x7
+        return [self.get_symmetric_column(move, n_columns) for move in history]
 
     def get_symmetric_column(self, column: int, n_columns: int) -> int:
         """Zwraca symetryczne odbicie kolumny."""
@@ -278,11 +367,14 @@ class Player:
 
     def is_valid_move(self, game: Game, column: int) -> bool:
         """Sprawdza czy ruch jest legalny."""
-        return (0 <= column < game.n_columns and 
-                len(game.board[column]) < game.n_rows)
+        return game.can_play(column)
 
     def make_move(self, game: Game) -> int:
         """Zwraca kolumnę dla najlepszego ruchu."""
+        if self.use_bitboard:
+            # Plansza bitowa sama utrzymuje sumy ocen okien
+            game = BitBoard.from_game(game, self.get_window_tables(game.winning_length))
+        
         valid_moves = self.get_valid_moves(game)
         if not valid_moves:
             return 0
@@ -295,21 +387,17 @@ class Player:
             print(f"Using opening book move: {opening_move}")
             return opening_move
         
-        # Sprawdź czy można wygrać w jednym ruchu
-        for col in valid_moves:
-            game_copy = self.make_move_copy(game, col)
-            if game_copy.check_winner() == game.current_player:
-                return col
-        
-        # Sprawdź czy trzeba zablokować przeciwnika
-        for col in valid_moves:
-            game_copy = copy.deepcopy(game)
-            game_copy.current_player = 1 - game_copy.current_player  # Symuluj ruch przeciwnika
-            game_copy.board[col].append(game_copy.current_player)
-            if game_copy.check_winner() == game_copy.current_player:
-                return col
+        # Wygrana w jednym ruchu albo jedyny nieprzegrywający ruch - z masek bitowych
+        board = game if isinstance(game, BitBoard) else BitBoard.from_game(game)
+        winning_moves = board.move_columns(board.winning_moves())
+        if winning_moves:
+            return winning_moves[0]
+        safe_moves = board.move_columns(board.non_losing_moves())
+        if len(safe_moves) == 1:
+            return safe_moves[0]
         
         # Użyj alpha-beta
+        self.nodes_visited = 0
         _, best_column = self.alpha_beta(game, self.max_depth, float('-inf'), float('inf'), True)
         
         if best_column is None or best_column not in valid_moves:
@@ -322,7 +410,8 @@ class Player:
         return best_column
 
     def alpha_beta(self, game: Game, depth: int, alpha: float, beta: float, maximizing_player: bool):
-        """Implementacja algorytmu alpha-beta pruning."""
+        """Implementacja algorytmu alpha-beta pruning (ruch i cofnięcie na tej samej planszy)."""
+        self.nodes_visited += 1
         winner = game.check_winner()
         
         # Warunki końcowe
@@ -339,6 +428,21 @@ class Player:
         if not valid_moves:
             return 0, None
         
+        if isinstance(game, BitBoard):
+            # Wymuszenia: wygrana gracza na ruchu w jednym ruchu, pozycja przegrana
+            # (podwójne zagrożenie) i odrzucenie ruchów oddających wygraną przeciwnikowi
+            sign = 1 if maximizing_player else -1
+            winning = game.winning_moves()
+            if winning:
+                return sign * 10000, game.move_columns(winning)[0]
+            non_losing = game.non_losing_moves()
+            if not non_losing:
+                return -sign * 10000, valid_moves[0]
+            # W pozycji symetrycznej wystarczą kolumny lewej połowy (reszta to odbicia)
+            if game.is_symmetric():
+                non_losing &= game.left_half_mask
+            valid_moves = game.move_columns(non_losing)
+        
         # Sortuj ruchy - preferuj środek planszy
         valid_moves = self.order_moves(game, valid_moves)
         
@@ -347,8 +451,9 @@ class Player:
         if maximizing_player:
             max_eval = float('-inf')
             for col in valid_moves:
-                game_copy = self.make_move_copy(game, col)
-                eval_score, _ = self.alpha_beta(game_copy, depth - 1, alpha, beta, False)
+                game.make_move(col)
+                eval_score, _ = self.alpha_beta(game, depth - 1, alpha, beta, False)
+                game.undo_move(col)
                 
                 if eval_score > max_eval:
                     max_eval = eval_score
@@ -362,8 +467,9 @@ class Player:
         else:
             min_eval = float('inf')
             for col in valid_moves:
-                game_copy = self.make_move_copy(game, col)
-                eval_score, _ = self.alpha_beta(game_copy, depth - 1, alpha, beta, True)
+                game.make_move(col)
+                eval_score, _ = self.alpha_beta(game, depth - 1, alpha, beta, True)
+                game.undo_move(col)
                 
                 if eval_score < min_eval:
                     min_eval = eval_score
@@ -389,15 +495,7 @@ class Player:
 
     def get_valid_moves(self, game: Game) -> list[int]:
         """Zwraca listę dostępnych kolumn."""
-        return [col for col in range(game.n_columns) if len(game.board[col]) < game.n_rows]
-
-    def make_move_copy(self, game: Game, column: int) -> Game:
-        """Tworzy kopię gry z wykonanym ruchem."""
-        game_copy = copy.deepcopy(game)
-        game_copy.board[column].append(game_copy.current_player)
-        game_copy.move_history.append(column)
-        game_copy.current_player = 1 - game_copy.current_player
-        return game_copy
+        return [col for col in range(game.n_columns) if game.can_play(col)]
 
     def evaluate_position(self, game: Game) -> float:
         """Ocenia pozycję na planszy."""
@@ -411,78 +509,47 @@ class Player:
         score += self.evaluate_all_windows(game, my_player) * 1.0
         score -= self.evaluate_all_windows(game, opp_player) * 1.1  # Nieco wyższa waga dla obrony
         
-        # Bonus za środek planszy
-        center_col = game.n_columns // 2
-        center_count = sum(1 for piece in game.board[center_col] if piece == my_player)
-        score += center_count * 10
+        # Bonus za środek planszy (przy parzystej liczbie kolumn - obie środkowe kolumny,
+        # żeby ocena pozycji i jej odbicia lustrzanego była równa)
+        for center_col in {(game.n_columns - 1) // 2, game.n_columns // 2}:
+            if isinstance(game, BitBoard):
+                center_count = game.count_pieces(game.current_position,
+                                                 game.column_mask(center_col))
+            else:
+                center_count = sum(1 for piece in game.board[center_col] if piece == my_player)
+            score += center_count * 10
         
         return score
 
+    def get_window_tables(self, winning_length: int) -> list:
+        """Zwraca tablice ocen okien [gracz 0, gracz 1] indeksowane kodem trójkowym okna."""
+        if winning_length not in self.window_tables:
+            self.window_tables[winning_length] = build_window_table(winning_length, self.evaluate_window)
+        return self.window_tables[winning_length]
+
     def evaluate_all_windows(self, game: Game, player: int) -> float:
         """Ocenia wszystkie możliwe okna dla danego gracza."""
+        if isinstance(game, BitBoard) and game.line_tables is not None:
+            return game.line_totals[player]
+        
         score = 0
-        win_len = game.winning_length
-        
-        # Sprawdź wszystkie możliwe okna poziome
-        for row in range(game.n_rows):
-            for col in range(game.n_columns - win_len + 1):
-                window = self.get_horizontal_window(game, row, col, win_len)
-                score += self.evaluate_window(window, player)
-        
-        # Sprawdź wszystkie możliwe okna pionowe
-        for col in range(game.n_columns):
-            for row in range(game.n_rows - win_len + 1):
-                window = self.get_vertical_window(game, col, row, win_len)
-                score += self.evaluate_window(window, player)
-        
-        # Sprawdź wszystkie możliwe okna ukośne (\ direction)
-        for row in range(game.n_rows - win_len + 1):
-            for col in range(game.n_columns - win_len + 1):
-                window = self.get_diagonal_window(game, row, col, win_len, 1)
-                score += self.evaluate_window(window, player)
-        
-        # Sprawdź wszystkie możliwe okna ukośne (/ direction)
-        for row in range(win_len - 1, game.n_rows):
-            for col in range(game.n_columns - win_len + 1):
-                window = self.get_diagonal_window(game, row, col, win_len, -1)
-                score += self.evaluate_window(window, player)
+        board = game.board
+        window_table = self.get_window_tables(game.winning_length)[player]
+        
+        # Geometria okien jest liczona raz na konfigurację planszy, a ocena okna
+        # to jeden odczyt z tablicy po zakodowaniu okna w systemie trójkowym
+        line_index = get_line_index(game.n_rows, game.n_columns, game.winning_length)
+        for cells in line_index.lines:
+            code = 0
+            for weight, (col, row) in zip(WINDOW_POWERS, cells):
+                if len(board[col]) > row:
+                    code += (board[col][row] + 1) * weight
+            score += window_table[code]
         
         return score
 
-    def get_horizontal_window(self, game: Game, row: int, start_col: int, length: int) -> list:
-        """Pobiera poziome okno."""
-        window = []
-        for col in range(start_col, start_col + length):
-            if len(game.board[col]) > row:
-                window.append(game.board[col][row])
-            else:
-                window.append(None)
-        return window
-
-    def get_vertical_window(self, game: Game, col: int, start_row: int, length: int) -> list:
-        """Pobiera pionowe okno."""
-        window = []
-        for row in range(start_row, start_row + length):
-            if len(game.board[col]) > row:
-                window.append(game.board[col][row])
-            else:
-                window.append(None)
-        return window
-
-    def get_diagonal_window(self, game: Game, start_row: int, start_col: int, length: int, direction: int) -> list:
-        """Pobiera ukośne okno. direction: 1 dla \, -1 dla /"""
-        window = []
-        for i in range(length):
-            row = start_row + (i * direction)
-            col = start_col + i
-            if 0 <= row < game.n_rows and 0 <= col < game.n_columns and len(game.board[col]) > row:
-                window.append(game.board[col][row])
-            else:
-                window.append(None)
-        return window
-
     def evaluate_window(self, window: list, player: int) -> float:
-        """Ocenia pojedyncze okno z lepszą heurystyką."""
+        """Ocenia pojedyncze okno dowolnej długości (używana do budowy tablicy ocen)."""
         score = 0
         opp_player = 1 - player
         
@@ -495,35 +562,41 @@ class Player:
             return 0
         
         # Ocena na podstawie liczby naszych kawałków
-        if player_count == 4:
+        if player_count == len(window):
             score += 1000
-        elif player_count == 3 and empty_count == 1:
+        elif empty_count == 1:
             score += 50
-        elif player_count == 2 and empty_count == 2:
+        elif empty_count == 2 and player_count >= 2:
             score += 10
-        elif player_count == 1 and empty_count == 3:
+        elif player_count >= 1:
             score += 1
         
         return score
     
-# Stwórz nową grę
-game = Game()
+def main():
+    """Gra człowieka (gracz 0, numer kolumny z klawiatury) z Player na planszy 7x7."""
+    # Stwórz nową grę
+    game = Game()
+
+    # Stwórz gracza AI
+    ai_player = Player()
+
+    # Przykładowa gra 
+    winner = None
+
+    while winner is None:
+        game.print_board()
+        if game.current_player == 0:
+            move = int(input())
+            game.make_move(move)
+        else:
+            best_move = ai_player.make_move(game)
+            game.make_move(best_move)
+        winner = game.check_winner()
 
-# Stwórz gracza AI
-ai_player = Player()
+    game.print_board()
+    print(f"wygral gracz {winner}")
 
-# Przykładowa gra 
-winner = None
 
-while winner is None:
-    game.print_board()
-    if game.current_player == 0:
-        move = int(input())
-        game.make_move(move)
-    else:
-        best_move = ai_player.make_move(game)
-        game.make_move(best_move)
-    winner = game.check_winner()
-
-game.print_board()
-print(f"wygral gracz {winner}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+# Kierunki linii (przesunięcie kolumny, przesunięcie wiersza): pionowo, poziomo, ukośnie / i \
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class LineIndex:
+    """
+    Geometria wszystkich linii wygrywających dla jednej konfiguracji planszy.
+
+    lines :
+        lista linii, każda jako krotka winning_length pól (col, row)
+    cell_lines :
+        odwrotne mapowanie - cell_lines[col][row] to krotka par
+        (indeks linii, pozycja pola w tej linii) dla wszystkich linii przez pole
+
+    Obiekty są budowane raz na konfigurację (get_line_index) i współdzielone
+    przez plansze i silniki, więc nie wolno ich modyfikować.
+    """
+    n_rows: int
+    n_columns: int
+    winning_length: int
+    lines: List[Tuple[Tuple[int, int], ...]]
+    cell_lines: List[List[Tuple[Tuple[int, int], ...]]]
+
+    def __init__(self, n_rows: int, n_columns: int, winning_length: int):
+        self.n_rows = n_rows
+        self.n_columns = n_columns
+        self.winning_length = winning_length
+
+        self.lines = []
+        for col in range(n_columns):
+            for row in range(n_rows):
+                for d_col, d_row in DIRECTIONS:
+                    end_col = col + (winning_length - 1) * d_col
+                    end_row = row + (winning_length - 1) * d_row
+                    if 0 <= end_col < n_columns and 0 <= end_row < n_rows:
+                        self.lines.append(tuple((col + i * d_col, row + i * d_row)
+                                                for i in range(winning_length)))
+
+        cell_lines = [[[] for _ in range(n_rows)] for _ in range(n_columns)]
+        for line, cells in enumerate(self.lines):
+            for position, (col, row) in enumerate(cells):
+                cell_lines[col][row].append((line, position))
+        self.cell_lines = [[tuple(entries) for entries in column] for column in cell_lines]
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+
+@lru_cache(maxsize=None)
+def get_line_index(n_rows: int, n_columns: int, winning_length: int) -> LineIndex:
+    """Zwraca (budowany raz i zapamiętywany) indeks linii dla danej konfiguracji."""
+    return LineIndex(n_rows, n_columns, winning_length)
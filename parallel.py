@@ -0,0 +1,174 @@
+import contextlib
+import io
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+from bitboard import BitBoard
+from transposition import TranspositionTable
+
+# Odstęp numerów ziaren kolejności ruchów kolejnych procesów pomocniczych
+SEED_STRIDE = 7919
+
+
+def attach_table(name: str, size_mb: int) -> Tuple[shared_memory.SharedMemory, TranspositionTable]:
+    """Podłącza transposition table z istniejącego bloku pamięci współdzielonej."""
+    memory = shared_memory.SharedMemory(name=name)
+    table = TranspositionTable(size_mb, memory.buf.cast('Q'))
+    return memory, table
+
+
+def helper_search(worker_id: int, memory_name: str, size_mb: int, generation: int,
+                  geometry: Tuple[int, int, int], history: List[int], engine_kwargs: Dict,
+                  start_time: float, stop_event, results):
+    """
+    Proces pomocniczy Lazy SMP: przeszukuje ten sam korzeń co proces główny ze
+    wspólną transposition table, ale z przesuniętymi głębokościami (nieparzyste
+    procesy zaczynają od głębokości nieparzystej) i zaburzoną kolejnością ruchów.
+    Wyniki ukończonych głębokości trafiają do kolejki results.
+    """
+    from test2 import UnbeatableAI
+
+    memory, table = attach_table(memory_name, size_mb)
+    depth_stats, nodes = [], 0
+    try:
+        engine = UnbeatableAI(solver_threshold=None, **engine_kwargs)
+        table.generation = generation
+        engine.transposition_table = table
+        engine.stop_event = stop_event
+        engine.start_depth += worker_id % 2
+        engine.order_jitter = 200
+        engine.order_rng.seed(worker_id * SEED_STRIDE)
+
+        game = BitBoard(*geometry, engine.get_line_tables(geometry[2]))
+        for col in history:
+            game.make_move(col)
+
+        engine.reset_stats()
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.iterative_deepening(game, game.get_valid_moves()[0], start_time)
+        depth_stats, nodes = engine.depth_stats, engine.nodes_visited
+
+        # Ukończona docelowa głębokość - pozostali mogą przestać
+        if depth_stats and depth_stats[-1][0] >= engine.max_depth:
+            stop_event.set()
+    finally:
+        results.put((worker_id, depth_stats, nodes))
+        engine = table = None
+        memory.close()
+
+
+class LazySMP:
+    """
+    Równoległe przeszukiwanie Lazy SMP dla UnbeatableAI.
+
+    Proces główny przeszukuje korzeń jak zwykle (jako worker 0), a workers - 1
+    procesów pomocniczych przeszukuje tę samą pozycję z innymi głębokościami
+    i kolejnością ruchów. Jedyną komunikacją w trakcie przeszukiwania jest wspólna
+    transposition table w multiprocessing.shared_memory (bez blokad - wpisy są
+    weryfikowane przez XOR klucza z danymi). Wynikiem jest ruch z najgłębszej
+    ukończonej iteracji spośród wszystkich procesów.
+    """
+
+    def __init__(self, engine, workers: int):
+        self.engine = engine
+        self.workers = workers
+        self.context = multiprocessing.get_context()
+
+        # Tablica silnika przenoszona do pamięci współdzielonej
+        size_mb = engine.transposition_table.size_mb
+        self.memory = shared_memory.SharedMemory(
+            create=True, size=TranspositionTable.table_bytes(size_mb))
+        self.memory.buf[:] = bytes(self.memory.size)
+        self.table = TranspositionTable(size_mb, self.memory.buf.cast('Q'))
+        self.table.generation = engine.transposition_table.generation
+        engine.transposition_table = self.table
+
+        # (worker, depth_stats, węzły) ostatniego przeszukiwania
+        self.last_results = []
+
+    def search(self, game: BitBoard, best_move: int, start_time: float) -> int:
+        """Przeszukuje pozycję wszystkimi procesami i zwraca ruch z najgłębszej iteracji."""
+        engine = self.engine
+        stop_event = self.context.Event()
+        results = self.context.Queue()
+        geometry = (game.n_rows, game.n_columns, game.winning_length)
+        engine_kwargs = {
+            'max_depth': engine.max_depth,
+            'time_limit': engine.time_limit,
+            'node_limit': engine.node_limit,
+            'check_interval': engine.check_interval,
+            'search_driver': engine.search_driver,
+            'batch_leaves': engine.batch_leaves,
+            # Ocena liści z rozszerzeniem zagrożeń musi być taka sama we wszystkich
+            # procesach - wszystkie zapisują wyniki do jednej TT
+            'threat_depth': engine.threat_depth,
+            'threat_extension': engine.threat_extension,
+        }
+
+        helpers = [self.context.Process(
+            target=helper_search,
+            args=(worker_id, self.memory.name, self.table.size_mb, self.table.generation,
+                  geometry, list(game.move_history), engine_kwargs, start_time,
+                  stop_event, results),
+            daemon=True) for worker_id in range(1, self.workers)]
+        for helper in helpers:
+            helper.start()
+
+        # Proces główny jest zatrzymywany przez stop_event (SearchAborted w środku drzewa) -
+        # iterative_deepening musi oddać planszę w pozycji korzenia
+        root_history = list(game.move_history)
+        engine.stop_event = stop_event
+        try:
+            engine.iterative_deepening(game, best_move, start_time)
+        finally:
+            engine.stop_event = None
+            stop_event.set()
+        if game.move_history != root_history:
+            raise AssertionError(f"Lazy SMP: plansza po przeszukiwaniu ma "
+                                 f"{len(game.move_history)} półruchów, korzeń - {len(root_history)}")
+
+        self.last_results = [(0, engine.depth_stats, engine.nodes_visited)]
+        for _ in helpers:
+            try:
+                self.last_results.append(results.get(timeout=10))
+            except queue.Empty:
+                break
+        for helper in helpers:
+            helper.join(timeout=1)
+            if helper.is_alive():
+                helper.terminate()
+
+        engine.nodes_visited = sum(nodes for _, _, nodes in self.last_results)
+        deepest = self.deepest_result()
+        if deepest is None:
+            return best_move
+        return deepest[4]
+
+    def deepest_result(self) -> Optional[Tuple]:
+        """Najgłębsza ukończona iteracja (przy równej głębokości - niższy numer procesu)."""
+        candidates = [(stats[0], -worker_id, stats)
+                      for worker_id, depth_stats, _ in self.last_results
+                      for stats in depth_stats if stats[4] is not None]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda candidate: candidate[:2])[2]
+
+    def time_to_depth(self) -> Dict[int, float]:
+        """Dla każdej głębokości - najkrótszy czas (od startu), w którym ukończył ją dowolny proces."""
+        times = {}
+        for _, depth_stats, _ in self.last_results:
+            for depth, _, elapsed, _, _ in depth_stats:
+                times[depth] = min(times.get(depth, elapsed), elapsed)
+        return times
+
+    def close(self):
+        """Zwalnia pamięć współdzieloną (silnik wraca do prywatnej tablicy)."""
+        if self.memory is None:
+            return
+        self.engine.transposition_table = TranspositionTable(self.table.size_mb)
+        self.table = None
+        self.memory.close()
+        self.memory.unlink()
+        self.memory = None
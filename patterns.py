@@ -0,0 +1,34 @@
+from typing import Callable, List, Optional
+
+# Okno (linia winning_length pól) kodowane jest w systemie trójkowym: cyfra na
+# pozycji i to 0 dla pustego pola, 1 dla pionka gracza 0 i 2 dla pionka gracza 1.
+MAX_WINDOW_LENGTH = 10
+WINDOW_POWERS = tuple(3 ** i for i in range(MAX_WINDOW_LENGTH))
+
+
+def encode_window(window: List[Optional[int]]) -> int:
+    """Koduje okno (lista symboli 0/1/None) jako liczbę w systemie trójkowym."""
+    code = 0
+    for weight, cell in zip(WINDOW_POWERS, window):
+        if cell is not None:
+            code += (cell + 1) * weight
+    return code
+
+
+def decode_window(code: int, length: int) -> List[Optional[int]]:
+    """Odtwarza okno z kodu trójkowego."""
+    window = []
+    for _ in range(length):
+        digit = code % 3
+        window.append(None if digit == 0 else digit - 1)
+        code //= 3
+    return window
+
+
+def build_window_table(length: int, evaluate: Callable[[List[Optional[int]], int], float]) -> List[List[float]]:
+    """
+    Buduje tablicę ocen okien: table[player][code] = evaluate(okno, player)
+    dla wszystkich 3 ** length możliwych okien danej długości.
+    """
+    windows = [decode_window(code, length) for code in range(3 ** length)]
+    return [[evaluate(window, player) for window in windows] for player in [0, 1]]
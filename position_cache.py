@@ -0,0 +1,154 @@
+import os
+import sqlite3
+import time
+from typing import Dict, Optional, Tuple
+
+from bitboard import BitBoard
+
+# Domyślny plik pamięci podręcznej pozycji (współdzielony przez kolejne uruchomienia)
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'connect4_positions.sqlite')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    key INTEGER NOT NULL,
+    n_rows INTEGER NOT NULL,
+    n_columns INTEGER NOT NULL,
+    winning_length INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    score REAL NOT NULL,
+    move INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (key, n_rows, n_columns, winning_length)
+);
+CREATE INDEX IF NOT EXISTS positions_last_used ON positions (last_used);
+"""
+
+UPSERT = """
+INSERT INTO positions (key, n_rows, n_columns, winning_length, depth, score, move, last_used)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (key, n_rows, n_columns, winning_length) DO UPDATE SET
+    depth = excluded.depth, score = excluded.score, move = excluded.move,
+    last_used = excluded.last_used
+WHERE excluded.depth >= positions.depth
+"""
+
+
+def signed_key(key: int) -> int:
+    """Zamienia 64-bitowy klucz Zobrista na liczbę ze znakiem (typ INTEGER w SQLite)."""
+    return key - (1 << 64) if key >= 1 << 63 else key
+
+
+class PositionCache:
+    """
+    Trwała pamięć podręczna wyników głębokich przeszukiwań i solvera (plik SQLite).
+
+    Pozycje rozwiązane dokładnie mają głębokość solver.SOLVED_DEPTH i wynik solvera (nie
+    ocenę heurystyczną). Wpis to (głębokość, wynik, ruch) dla pozycji o danym kanonicznym kluczu Zobrista
+    (BitBoard.canonical_hash) i geometrii planszy; ruch jest zapisany w układzie
+    pozycji kanonicznej i odbijany przy odczycie. Połączenie z bazą otwierane jest
+    dopiero przy pierwszym zapytaniu. Zapisy i znaczniki ostatniego użycia czekają
+    w pamięci do flush() - baza nie jest blokowana w trakcie przeszukiwania.
+
+    Rozmiar jest ograniczony do max_entries wpisów: przy flush() nadmiar usuwany jest
+    w kolejności najdawniej używanych (LRU), z zapasem evict_fraction, żeby nie
+    usuwać przy każdym zapisie.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = 100_000,
+                 evict_fraction: float = 0.1):
+        self.path = path
+        self.max_entries = max_entries
+        self.evict_fraction = evict_fraction
+        self.connection = None
+        self.entry_count = 0
+
+        # Oczekujące zapisy: klucz wiersza -> (głębokość, wynik, ruch); użyte wpisy -> czas
+        self.pending: Dict[Tuple[int, int, int, int], Tuple[int, float, int]] = {}
+        self.touched: Dict[Tuple[int, int, int, int], float] = {}
+
+        # Statystyki
+        self.probes = 0
+        self.hits = 0
+
+    def connect(self) -> sqlite3.Connection:
+        """Otwiera (przy pierwszym użyciu) połączenie z bazą i tworzy tabelę."""
+        if self.connection is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            # Pondering korzysta z pamięci z wątku w tle, ale nigdy równocześnie z make_move
+            self.connection = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            self.connection.executescript(SCHEMA)
+            self.entry_count = self.connection.execute(
+                "SELECT COUNT(*) FROM positions").fetchone()[0]
+        return self.connection
+
+    def row_key(self, board: BitBoard) -> Tuple[Tuple[int, int, int, int], bool]:
+        """Klucz wiersza (kanoniczny klucz, geometria) i informacja o odbiciu pozycji."""
+        key, mirrored = board.canonical_hash()
+        return (signed_key(key), board.n_rows, board.n_columns, board.winning_length), mirrored
+
+    def probe(self, board: BitBoard) -> Optional[Tuple[int, float, int]]:
+        """Zwraca (głębokość, wynik, ruch) dla pozycji albo None."""
+        self.probes += 1
+        row_key, mirrored = self.row_key(board)
+        entry = self.pending.get(row_key)
+        if entry is None:
+            entry = self.connect().execute(
+                "SELECT depth, score, move FROM positions "
+                "WHERE key = ? AND n_rows = ? AND n_columns = ? AND winning_length = ?",
+                row_key).fetchone()
+            if entry is None:
+                return None
+            self.touched[row_key] = time.time()
+
+        self.hits += 1
+        depth, score, move = entry
+        if mirrored:
+            move = board.mirror_column(move)
+        return depth, score, move
+
+    def store(self, board: BitBoard, depth: int, score: float, move: int):
+        """Zapamiętuje wynik przeszukiwania pozycji (zapis do bazy przy flush)."""
+        row_key, mirrored = self.row_key(board)
+        if mirrored:
+            move = board.mirror_column(move)
+        previous = self.pending.get(row_key)
+        if previous is None or depth >= previous[0]:
+            self.pending[row_key] = (depth, score, move)
+
+    def flush(self):
+        """Zapisuje oczekujące wpisy i znaczniki użycia, usuwa nadmiar wpisów (LRU)."""
+        if not self.pending and not self.touched:
+            return
+        connection = self.connect()
+        now = time.time()
+        try:
+            with connection:
+                connection.executemany(
+                    "UPDATE positions SET last_used = ? "
+                    "WHERE key = ? AND n_rows = ? AND n_columns = ? AND winning_length = ?",
+                    [(used, *row_key) for row_key, used in self.touched.items()])
+                connection.executemany(
+                    UPSERT, [(*row_key, *entry, now) for row_key, entry in self.pending.items()])
+                self.entry_count = connection.execute(
+                    "SELECT COUNT(*) FROM positions").fetchone()[0]
+                if self.entry_count > self.max_entries:
+                    excess = self.entry_count - int(self.max_entries * (1 - self.evict_fraction))
+                    connection.execute(
+                        "DELETE FROM positions WHERE rowid IN "
+                        "(SELECT rowid FROM positions ORDER BY last_used LIMIT ?)", (excess,))
+                    self.entry_count -= excess
+        except sqlite3.OperationalError as error:
+            # Baza zablokowana przez inny proces - wpisy zostaną zapisane przy następnym flush
+            print(f"⚠️ Pamięć podręczna pozycji niedostępna: {error}")
+            return
+        self.pending.clear()
+        self.touched.clear()
+
+    def close(self):
+        """Zapisuje oczekujące wpisy i zamyka połączenie."""
+        self.flush()
+        if self.connection is None:
+            return
+        self.connection.close()
+        self.connection = None
@@ -0,0 +1,215 @@
+from typing import Callable, List, Optional, Tuple
+
+from bitboard import BitBoard
+
+# Głębokość, pod którą zapisywane są wyniki pozycji rozwiązanych dokładnie (np. w
+# position_cache) - większa od każdej głębokości przeszukiwania heurystycznego
+SOLVED_DEPTH = 255
+
+
+class Solver:
+    """
+    Dokładny solver Connect 4 (negamax z oknem zerowym na maskach bitowych).
+
+    Wynik pozycji liczony jest z perspektywy gracza na ruchu:
+        0  - remis przy najlepszej grze obu stron,
+        >0 - wygrana; im szybsza, tym wyższy (liczba własnych pionków, których
+             zwycięzcy zostało "w zapasie" w chwili wygranej, plus jeden),
+        <0 - przegrana (symetrycznie).
+    Dla pozycji z `moves` pionkami na planszy wygrywający ruch daje
+    (size + 1 - moves) // 2, gdzie size = n_rows * n_columns.
+
+    Przeszukiwanie zawęża przedział wyniku serią wywołań z oknem zerowym (alpha,
+    alpha + 1). Przegrywające ruchy (pod polem wygrywającym przeciwnika albo
+    nieblokujące jego zagrożenia) są odrzucane przed rekurencją. Solver ma własną
+    tabelę transpozycji z górnymi ograniczeniami wyniku, kluczowaną dokładnie
+    pozycją (position + mask jednoznacznie koduje układ pionków).
+    """
+
+    def __init__(self, n_rows: int, n_columns: int, winning_length: int,
+                 tt_size: int = (1 << 20) + 7, check_interval: int = 4096,
+                 on_interval: Optional[Callable[[int], None]] = None):
+        self.n_rows = n_rows
+        self.n_columns = n_columns
+        self.winning_length = winning_length
+        self.size = n_rows * n_columns
+
+        # Geometria masek bitowych (board_mask, bottom_mask, winning_positions, ...)
+        self.geometry = BitBoard(n_rows, n_columns, winning_length)
+        self.winning_positions = self.geometry.winning_positions
+        self.board_mask = self.geometry.board_mask
+        self.bottom_mask = self.geometry.bottom_mask
+
+        # Kolejność kolumn od środka - rozstrzyga remisy w sortowaniu ruchów
+        center = n_columns // 2
+        self.column_order = sorted(range(n_columns), key=lambda col: (abs(col - center), col))
+        self.column_masks = [((1 << n_rows) - 1) << (col * self.geometry.column_height)
+                             for col in range(n_columns)]
+
+        # Tabela transpozycji: klucz i górne ograniczenie wyniku
+        self.tt_size = tt_size
+        self.tt_keys: List[Optional[int]] = [None] * tt_size
+        self.tt_values: List[int] = [0] * tt_size
+
+        # Wywoływane co check_interval węzłów z bieżącą liczbą węzłów - może przerwać
+        # przeszukiwanie wyjątkiem (np. limit czasu silnika)
+        self.check_interval = check_interval
+        self.on_interval = on_interval
+        self.nodes = 0
+        self.next_check = check_interval
+
+    def reset_stats(self):
+        """Zeruje licznik węzłów."""
+        self.nodes = 0
+        self.next_check = self.check_interval
+
+    def clear(self):
+        """Czyści tabelę transpozycji."""
+        self.tt_keys = [None] * self.tt_size
+        self.tt_values = [0] * self.tt_size
+
+    def can_win_next(self, position: int, mask: int) -> bool:
+        """Sprawdza czy gracz na ruchu może wygrać najbliższym ruchem."""
+        return bool(self.winning_positions(position, mask) & (mask + self.bottom_mask)
+                    & self.board_mask)
+
+    def negamax(self, position: int, mask: int, moves: int, alpha: int, beta: int) -> int:
+        """
+        Wynik pozycji w oknie (alpha, beta). Zakłada, że gracz na ruchu nie może
+        wygrać najbliższym ruchem (sprawdza to wywołujący).
+        """
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self.next_check = self.nodes + self.check_interval
+            if self.on_interval is not None:
+                self.on_interval(self.nodes)
+
+        size = self.size
+        possible = (mask + self.bottom_mask) & self.board_mask
+        opponent_win = self.winning_positions(position ^ mask, mask)
+        forced = possible & opponent_win
+        if forced:
+            if forced & (forced - 1):
+                # Dwa zagrożenia naraz - przeciwnik wygrywa następnym ruchem
+                return -((size - moves) // 2)
+            possible = forced
+        # Nie stawiamy pionka pod polem wygrywającym przeciwnika
+        possible &= ~(opponent_win >> 1)
+        if not possible:
+            return -((size - moves) // 2)
+
+        # Zostały co najwyżej dwa pola, a żaden gracz nie może już wygrać
+        if moves >= size - 2:
+            return 0
+
+        # Przegrać można najwcześniej za dwa ruchy przeciwnika
+        min_score = -((size - 2 - moves) // 2)
+        if alpha < min_score:
+            alpha = min_score
+            if alpha >= beta:
+                return alpha
+
+        # Wygrać można najwcześniej drugim własnym ruchem
+        max_score = (size - 1 - moves) // 2
+        key = position + mask
+        index = key % self.tt_size
+        if self.tt_keys[index] == key:
+            max_score = self.tt_values[index]
+        if beta > max_score:
+            beta = max_score
+            if alpha >= beta:
+                return beta
+
+        # Ruchy tworzące najwięcej nowych zagrożeń najpierw
+        candidates = []
+        for col in self.column_order:
+            move = possible & self.column_masks[col]
+            if move:
+                threats = bin(self.winning_positions(position | move, mask | move)).count('1')
+                candidates.append((threats, move))
+        candidates.sort(key=lambda candidate: -candidate[0])
+
+        for _, move in candidates:
+            score = -self.negamax(position ^ mask, mask | move, moves + 1, -beta, -alpha)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        self.tt_keys[index] = key
+        self.tt_values[index] = alpha
+        return alpha
+
+    def solve_masks(self, position: int, mask: int, moves: int) -> int:
+        """Dokładny wynik pozycji zadanej maskami (gracz na ruchu nie może mieć już linii)."""
+        if moves >= self.size:
+            return 0
+        if self.can_win_next(position, mask):
+            return (self.size + 1 - moves) // 2
+
+        low = -((self.size - moves) // 2)
+        high = (self.size + 1 - moves) // 2
+        while low < high:
+            # Przeszukiwanie z oknem zerowym wokół środka przedziału, przesunięte w
+            # stronę zera - remisy i bliskie wyniki są najczęstsze
+            middle = low + (high - low) // 2
+            if middle <= 0 and int(low / 2) < middle:
+                middle = int(low / 2)
+            elif middle >= 0 and int(high / 2) > middle:
+                middle = int(high / 2)
+            score = self.negamax(position, mask, moves, middle, middle + 1)
+            if score <= middle:
+                high = score
+            else:
+                low = score
+        return low
+
+    def solve(self, board: BitBoard) -> int:
+        """Dokładny wynik pozycji z perspektywy gracza na ruchu."""
+        return self.solve_masks(board.current_position, board.mask, len(board.move_history))
+
+    def best_move(self, board: BitBoard) -> Tuple[int, int]:
+        """Zwraca (kolumna, wynik) najlepszego ruchu - wynik z perspektywy gracza na ruchu."""
+        position, mask = board.current_position, board.mask
+        moves = len(board.move_history)
+        possible = self.geometry.possible_moves(mask)
+        winning = self.winning_positions(position, mask) & possible
+
+        best_col, best_score = None, None
+        for col in self.column_order:
+            move = possible & self.column_masks[col]
+            if not move:
+                continue
+            if winning & move:
+                return col, (self.size + 1 - moves) // 2
+            score = -self.solve_masks(position ^ mask, mask | move, moves + 1)
+            if best_score is None or score > best_score:
+                best_col, best_score = col, score
+        return best_col, best_score
+
+    def score_to_distance(self, score: int, moves: int) -> int:
+        """
+        Zamienia wynik pozycji z `moves` pionkami na liczbę półruchów do końca gry
+        (do wygrywającego ruchu albo do zapełnienia planszy przy remisie).
+        """
+        if score == 0:
+            return self.size - moves
+        # Przed wygrywającym ruchem na planszy jest size + 1 - 2 * |score| albo
+        # size - 2 * |score| pionków; parzystość wyznacza, kto ten ruch wykonuje
+        winner_parity = moves % 2 if score > 0 else (moves + 1) % 2
+        moves_before_win = self.size + 1 - 2 * abs(score)
+        if moves_before_win % 2 != winner_parity:
+            moves_before_win -= 1
+        return moves_before_win - moves + 1
+
+    def analyze(self, board: BitBoard) -> Tuple[int, int]:
+        """
+        Zwraca (rezultat, odległość): rezultat 1 / 0 / -1 to wygrana / remis / przegrana
+        gracza na ruchu, odległość to liczba półruchów do końca gry przy najlepszej grze.
+        """
+        if board.check_winner() is not None:
+            return -1, 0
+        moves = len(board.move_history)
+        score = self.solve(board)
+        result = (score > 0) - (score < 0)
+        return result, self.score_to_distance(score, moves)
@@ -1,10 +1,19 @@
 import random
 import copy
+import threading
 import time
 import math
 from typing import Optional, Tuple, List, Dict
 from collections import defaultdict
 
+from bitboard import BitBoard
+from book import open_book
+from lines import get_line_index
+from solver import Solver, SOLVED_DEPTH
+from threats import forced_win
+from patterns import build_window_table, encode_window
+from transposition import TranspositionTable, BOUND_EXACT, BOUND_LOWER, BOUND_UPPER
+
 class Game:
     """
     Klasa reprezentująca rozgrywkę Connect 4 z grawitacją.
@@ -68,6 +77,23 @@ class Game:
             self.move_history.pop()
             self.current_player = 1 - self.current_player
     
+    def can_play(self, column: int) -> bool:
+        """Sprawdza czy w kolumnie jest miejsce."""
+        return 0 <= column < self.n_columns and len(self.board[column]) < self.n_rows
+
+    def is_winning_move(self, column: int, player: Optional[int] = None) -> bool:
+        """Sprawdza czy postawienie pionka gracza (domyślnie gracza na ruchu) w kolumnie wygrywa."""
+        if not self.can_play(column):
+            return False
+        if player is None:
+            player = self.current_player
+        
+        row = len(self.board[column])
+        self.board[column].append(player)
+        wins = self.check_winner_from_position(column, row, player) == player
+        self.board[column].pop()
+        return wins
+    
     def is_terminal(self) -> bool:
         """Sprawdza czy gra się skończyła."""
         return self.check_winner() is not None or self.is_board_full()
@@ -185,28 +211,130 @@ class Game:
                     return True
         return False
 
+class SearchAborted(Exception):
+    """Przerwanie przeszukiwania po przekroczeniu limitu czasu lub liczby węzłów."""
+
+
 class UnbeatableAI:
     """NIEPRZEZWYCIĘŻONA wersja AI - używa zaawansowanych technik."""
     
-    def __init__(self, max_depth: int = 12):
-        self.team_name = "UNBEATABLE AI"
+    # Wyniki o module co najmniej WIN_THRESHOLD oznaczają wygraną / przegraną
+    WIN_THRESHOLD = 9000
+    
+    SEARCH_DRIVERS = ('aspiration', 'mtdf')
+    PONDER_MODES = (None, 'expected', 'all')
+    
+    def __init__(self, max_depth: int = 12, tt_size_mb: int = 16, batch_leaves: bool = False,
+                 time_limit: Optional[float] = 5.0, node_limit: Optional[int] = None,
+                 check_interval: int = 1024, search_driver: str = 'aspiration',
+                 solver_threshold: Optional[int] = 16, workers: int = 1,
+                 ponder: Optional[str] = None, threat_depth: int = 8, threat_extension: int = 0,
+                 use_book: bool = True, cache_path: Optional[str] = None, cache_plies: int = 2,
+                 cache_size: int = 100_000):
+        if search_driver not in self.SEARCH_DRIVERS:
+            raise ValueError(f"Nieznany sterownik przeszukiwania: {search_driver}")
+        if ponder not in self.PONDER_MODES:
+            raise ValueError(f"Nieznany tryb pondering: {ponder}")
+        # Argumenty konstruktora - pozwalają odtworzyć silnik w innym procesie (turniej równoległy)
+        self.config = {'max_depth': max_depth, 'tt_size_mb': tt_size_mb,
+                       'batch_leaves': batch_leaves, 'time_limit': time_limit,
+                       'node_limit': node_limit, 'check_interval': check_interval,
+                       'search_driver': search_driver, 'solver_threshold': solver_threshold,
+                       'workers': workers, 'ponder': ponder, 'threat_depth': threat_depth,
+                       'threat_extension': threat_extension, 'use_book': use_book,
+                       'cache_path': cache_path, 'cache_plies': cache_plies,
+                       'cache_size': cache_size}
+        self.team_name = "UNBEATABLE AI" if search_driver == 'aspiration' else "UNBEATABLE AI (MTD(f))"
         self.team_members = ["Deep Blue Reborn"]
         self.max_depth = max_depth
         
+        # Sterownik korzenia: 'aspiration' (PVS z oknem aspiracyjnym) albo 'mtdf'
+        self.search_driver = search_driver
+        
+        # Limity na jeden ruch: czas w sekundach i/lub liczba węzłów (dla powtarzalnych
+        # przebiegów). Sprawdzane co check_interval węzłów wewnątrz przeszukiwania.
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.check_interval = check_interval
+        self.deadline = None
+        self.next_limit_check = check_interval
+        # Zdarzenie (threading/multiprocessing Event) przerywające przeszukiwanie z zewnątrz
+        self.stop_event = None
+        
+        # Pierwsza głębokość iterative deepening (kolejne co 2) oraz losowe zaburzenie
+        # kolejności ruchów - procesy pomocnicze Lazy SMP różnią się tymi ustawieniami
+        self.start_depth = 4
+        self.order_jitter = 0
+        self.order_rng = random.Random(0)
+        
+        # Pondering - przeszukiwanie w wątku w tle w czasie ruchu przeciwnika:
+        # 'expected' - pozycja po przewidywanej odpowiedzi (ruch z TT), 'all' - pozycja
+        # przeciwnika na ruchu (wszystkie odpowiedzi); None wyłącza
+        self.ponder = ponder
+        self.ponder_thread = None
+        self.ponder_stop = None
+        self.ponder_history = None
+        self.ponder_replies = []
+        self.ponder_depth = 0
+        self.pondering = False
+
+        # Liczba procesów przeszukujących (Lazy SMP, parallel.LazySMP); 1 = bez procesów
+        self.workers = workers
+        self.smp = None
+        
+        # Połowa szerokości okna aspiracyjnego wokół wyniku poprzedniej iteracji
+        self.aspiration_window = 50
+        
+        # Przeszukiwanie zagrożeń (threats.forced_win): przed iterative deepening do
+        # threat_depth zagrożeń, w liściach do threat_extension; 0 wyłącza
+        self.threat_depth = threat_depth
+        self.threat_extension = threat_extension
+        
+        # Dokładny solver (solver.Solver), gdy zostało co najwyżej solver_threshold
+        # wolnych pól; None wyłącza tryb rozwiązywania końcówek
+        self.solver_threshold = solver_threshold
+        self.solvers = {}
+        
+        # Trwała pamięć podręczna wyników (position_cache.PositionCache w pliku cache_path,
+        # tworzona przy pierwszym użyciu): sprawdzana w korzeniu i do cache_plies półruchów
+        # od korzenia, zapisywana po każdym przeszukaniu; None wyłącza
+        self.cache_path = cache_path
+        self.cache_plies = cache_plies
+        self.cache_size = cache_size
+        self.cache = None
+        
+        # Ocena liści ostatniego poziomu jednym wywołaniem NumPy (batch_eval)
+        self.batch_leaves = batch_leaves
+        self.batch_evaluators = {}
+        
         # Statystyki
         self.nodes_visited = 0
         self.pruning_count = 0
         self.search_time = 0
         self.current_depth = 0
+        self.depth_stats = []
         
         # Zaawansowane struktury danych
-        self.transposition_table = {}
+        self.transposition_table = TranspositionTable(tt_size_mb)
         self.killer_moves = [[] for _ in range(max_depth + 1)]
         self.history_table = defaultdict(int)
         
+        # Tablice wartości stanów linii dla BitBoard (dla każdej długości wygrywającej)
+        self.line_tables = {}
+        
+        # Maski pól z wagami dla oceny środka i wysokości (dla każdej geometrii planszy)
+        self.eval_masks = {}
+        
         # Prekalkulowane wzorce
         self.threat_patterns = self.precompute_threat_patterns()
         
+        # Księga otwarć z pliku (book.open_book) - ruchy przeszukane offline przez book.py;
+        # gdy dla geometrii nie ma pliku, pierwsze ruchy wybiera opening_book poniżej.
+        # Ruch z księgi płytszej niż max_depth jest tylko podpowiedzią kolejności w korzeniu:
+        # root_hint = (kolumna, głębokość księgi) na czas jednego przeszukiwania
+        self.use_book = use_book
+        self.root_hint = None
+        
         # Opening book - najlepsze pierwsze ruchy
         self.opening_book = {
             7: [3, 2, 4, 1, 5, 0, 6],  # Dla planszy 7x7
@@ -228,14 +356,34 @@ class UnbeatableAI:
         """Resetuje statystyki przeszukiwania."""
         self.nodes_visited = 0
         self.pruning_count = 0
+        self.depth_stats = []
         self.killer_moves = [[] for _ in range(self.max_depth + 1)]
 
     def make_move(self, game: Game) -> int:
         """Zwraca najlepszy ruch używając wszystkich technik."""
+        # Zatrzymaj pondering - od teraz stan silnika należy do tego ruchu
+        self.stop_pondering(game)
+
+        # Przeszukiwanie odbywa się na planszy bitowej z licznikami linii
+        game = BitBoard.from_game(game, self.get_line_tables(game.winning_length))
         valid_moves = self.get_valid_moves(game)
         if not valid_moves:
             return 0
         
+        # Księga otwarć z pliku - wyszukiwanie binarne w zmapowanym pliku. Ruch jest grany
+        # od razu, jeśli pozycje przeszukano przy budowie co najmniej tak głęboko jak
+        # przeszukałby silnik (albo silnik i tak by nie szukał - pierwsze dwa półruchy);
+        # z płytszej księgi ruch tylko ustawia kolejność w korzeniu przeszukiwania
+        book_hint = None
+        if self.use_book:
+            book = open_book(game.n_rows, game.n_columns, game.winning_length)
+            entry = book.probe(game) if book is not None else None
+            if entry is not None:
+                if book.depth >= self.max_depth or len(game.move_history) <= 2:
+                    print(f"📚 Księga otwarć: kolumna {entry[0]}")
+                    return entry[0]
+                book_hint = (entry[0], book.depth)
+        
         # Opening book - pierwsze ruchy
         if len(game.move_history) <= 2:
             return self.get_opening_move(game, valid_moves)
@@ -243,48 +391,299 @@ class UnbeatableAI:
         if len(valid_moves) == 1:
             return valid_moves[0]
         
-        # Sprawdź natychmiastowe zwycięstwo
-        winning_move = self.find_winning_move(game, valid_moves)
-        if winning_move is not None:
+        # Wymuszenia z masek bitowych: wygrana w jednym ruchu, jedyny nieprzegrywający
+        # ruch albo pozycja przegrana (wtedy przynajmniej blokujemy jedno zagrożenie)
+        winning_moves = game.move_columns(game.winning_moves())
+        if winning_moves:
             print("🎯 Znaleziono wygrywający ruch!")
-            return winning_move
-        
-        # Sprawdź czy trzeba blokować przeciwnika
-        blocking_move = self.find_blocking_move(game, valid_moves)
-        if blocking_move is not None:
-            print("🛡️ Blokowanie przeciwnika!")
-            return blocking_move
-        
-        # Resetuj statystyki
-        self.reset_stats()
-        self.current_depth = self.max_depth
-        
-        # Iterative deepening - zwiększaj głębokość stopniowo
-        best_move = valid_moves[0]
-        start_time = time.time()
-        
-        for depth in range(4, self.max_depth + 1, 2):
-            if time.time() - start_time > 5.0:  # Time limit 5 sekund
+            return winning_moves[0]
+        
+        safe_moves = game.move_columns(game.non_losing_moves())
+        if len(safe_moves) == 1:
+            print("🛡️ Jedyny nieprzegrywający ruch!")
+            return safe_moves[0]
+        if not safe_moves:
+            print("💀 Pozycja przegrana")
+            opponent_win = game.winning_positions(game.current_position ^ game.mask, game.mask)
+            threats = game.move_columns(opponent_win & game.possible_moves(game.mask))
+            return threats[0] if threats else valid_moves[0]
+        
+        # Wymuszona wygrana samymi zagrożeniami - nie trzeba pełnego przeszukiwania
+        if self.threat_depth:
+            forced = forced_win(game, self.threat_depth)
+            if forced is not None:
+                print(f"🗡️ Wymuszona wygrana zagrożeniami: kolumna {forced[0]} "
+                      f"({forced[1]} półruchów)")
+                return forced[0]
+        
+        # Trwała pamięć podręczna - pozycja przeszukana wcześniej co najmniej do max_depth
+        # (w końcówce - rozwiązana wcześniej przez solver)
+        empty_cells = game.n_rows * game.n_columns - len(game.move_history)
+        solve = self.solver_threshold is not None and empty_cells <= self.solver_threshold
+        cache = self.get_cache()
+        cached = cache.probe(game) if cache is not None else None
+        required_depth = SOLVED_DEPTH if solve else self.max_depth
+        if cached is not None and cached[0] >= required_depth:
+            print(f"💾 Pamięć podręczna pozycji: kolumna {cached[2]} "
+                  f"(głębokość {cached[0]})")
+            cache.flush()
+            best_move = cached[2]
+        else:
+            # Resetuj statystyki i rozpocznij nową generację w transposition table
+            self.reset_stats()
+            self.transposition_table.new_search()
+            self.current_depth = self.max_depth
+            # Pozycja korzenia do zapisu w pamięci podręcznej - niezależna od planszy,
+            # na której odbywa się przeszukiwanie
+            root = game.copy()
+            
+            # Ruch z płytszej księgi: pierwszy w korzeniu i ruch awaryjny, gdy limit
+            # przerwie już pierwszą iterację
+            fallback = valid_moves[0]
+            if book_hint is not None and book_hint[0] in valid_moves:
+                print(f"📚 Księga otwarć (głębokość {book_hint[1]}): "
+                      f"kolumna {book_hint[0]} jako pierwsza w korzeniu")
+                self.root_hint = book_hint
+                fallback = book_hint[0]
+            
+            start_time = time.time()
+            try:
+                if solve:
+                    # Końcówka - rozwiąż pozycję dokładnie
+                    best_move = self.solve_endgame(game, start_time)
+                elif self.workers > 1:
+                    # Lazy SMP - iterative deepening w kilku procesach ze wspólną TT
+                    best_move = self.parallel_search(game, fallback, start_time)
+                else:
+                    # Iterative deepening - zwiększaj głębokość stopniowo
+                    best_move = self.iterative_deepening(game, fallback, start_time)
+            finally:
+                self.root_hint = None
+            
+            if cache is not None:
+                # Wynik najgłębszej ukończonej iteracji (wpis solvera zapisuje solve_endgame)
+                if self.depth_stats and self.depth_stats[-1][4] is not None:
+                    depth, _, _, score, move = self.depth_stats[-1]
+                    cache.store(root, depth, score, move)
+                cache.flush()
+            
+            end_time = time.time()
+            self.search_time = end_time - start_time
+            
+            # Wyświetl statystyki
+            self.print_advanced_stats()
+        
+        # Ruch z pamięci podręcznej też kończy się tutaj - pondering działa jak po przeszukaniu
+        best_move = best_move if best_move in valid_moves else random.choice(valid_moves)
+        # Następna decyzja zapada po naszym ruchu i odpowiedzi przeciwnika (empty_cells - 2
+        # pustych pól) - jeśli tę pozycję i tak rozwiąże solver, pondering tylko zabiera CPU
+        if self.ponder is not None and empty_cells > (self.solver_threshold or 0) + 2:
+            self.start_pondering(game, best_move)
+        return best_move
+
+    def iterative_deepening(self, game: BitBoard, best_move: int, start_time: float) -> int:
+        """
+        Pogłębia przeszukiwanie co dwa półruchy aż do max_depth albo do przekroczenia limitu.
+        Dla każdej ukończonej głębokości zapisuje w depth_stats (głębokość, węzły, czas od
+        startu, wynik, ruch). Zwraca ruch z ostatniej ukończonej głębokości.
+        """
+        self.start_limits(start_time)
+        self.depth_stats = []
+        score = None
+        root_moves = len(game.move_history)
+        
+        for depth in range(self.start_depth, self.max_depth + 1, 2):
+            if self.deadline is not None and time.time() >= self.deadline:
                 break
                 
             self.current_depth = depth
             try:
-                _, move = self.alpha_beta_with_enhancements(
-                    game, depth, float('-inf'), float('inf'), True, 0
-                )
+                score, move = self.search_depth(game, depth, score)
                 if move is not None:
                     best_move = move
                     print(f"📊 Głębokość {depth}: wybrano kolumnę {move}")
+                self.depth_stats.append((depth, self.nodes_visited, time.time() - start_time,
+                                         score, move))
+            except SearchAborted:
+                # Ruch z ostatniej ukończonej głębokości pozostaje w best_move
+                print(f"⏰ Przerwano głębokość {depth} (limit czasu/węzłów)")
+                break
             except KeyboardInterrupt:
                 break
         
-        end_time = time.time()
-        self.search_time = end_time - start_time
-        
-        # Wyświetl statystyki
-        self.print_advanced_stats()
-        
-        return best_move if best_move in valid_moves else random.choice(valid_moves)
+        # Przerwanie w środku drzewa zostawia planszę kilka półruchów za korzeniem -
+        # make_move dalej korzysta z tej planszy (pamięć podręczna, pondering)
+        game.undo_to(root_moves)
+        return best_move
+
+    def search_depth(self, game: BitBoard, depth: int,
+                     previous_score: Optional[float]) -> Tuple[float, Optional[int]]:
+        """Jedna iteracja: okno aspiracyjne albo MTD(f) wokół wyniku poprzedniej głębokości."""
+        if self.search_driver == 'mtdf':
+            return self.mtdf(game, depth, previous_score)
+        return self.aspiration_search(game, depth, previous_score)
+
+    def start_pondering(self, game: BitBoard, move: int):
+        """
+        Uruchamia pondering po wybraniu ruchu move: wątek w tle pogłębia przeszukiwanie
+        pozycji po odpowiedziach przeciwnika - tylko po przewidywanej (ruch z TT, tryb
+        'expected') albo po wszystkich, zaczynając od przewidywanej (tryb 'all').
+        W trybie 'expected' bez przewidywanej odpowiedzi w TT pondering nie rusza.
+        Wyniki zostają w transposition table i są wykorzystane przez następne make_move.
+        """
+        board = game.copy()
+        board.make_move(move)
+        if board.is_terminal():
+            return
+
+        board_hash, mirrored = self.hash_board(board)
+        entry = self.transposition_table.probe(board_hash)
+        expected = entry[3] if entry is not None else None
+        if mirrored and expected is not None:
+            expected = board.mirror_column(expected)
+        replies = self.order_moves_advanced(board, self.get_valid_moves(board), 0)
+        if expected in replies:
+            replies.remove(expected)
+            replies.insert(0, expected)
+            if self.ponder == 'expected':
+                replies = [expected]
+        elif self.ponder == 'expected':
+            return
+
+        self.ponder_history = list(board.move_history)
+        self.ponder_replies = replies
+        self.ponder_stop = threading.Event()
+        self.ponder_thread = threading.Thread(target=self.ponder_search,
+                                              args=(board, replies, self.ponder_stop), daemon=True)
+        self.ponder_thread.start()
+
+    def ponder_search(self, game: BitBoard, replies: List[int], stop_event):
+        """
+        Iterative deepening bez limitów czasu i węzłów (do max_depth albo do stop_event):
+        na każdej głębokości przeszukuje po kolei pozycje po każdej z odpowiedzi.
+        """
+        self.pondering = True
+        self.stop_event = stop_event
+        self.deadline = None
+        self.next_limit_check = self.check_interval
+        self.ponder_depth = 0
+        self.reset_stats()
+        scores = dict.fromkeys(replies)
+        root_moves = len(game.move_history)
+        try:
+            for depth in range(self.start_depth, self.max_depth + 1, 2):
+                for reply in replies:
+                    game.make_move(reply)
+                    if not game.is_terminal():
+                        scores[reply], _ = self.search_depth(game, depth, scores[reply])
+                    game.undo_move()
+                self.ponder_depth = depth
+        except SearchAborted:
+            pass
+        finally:
+            # Po przerwaniu plansza może być dowolnie głęboko w drzewie
+            game.undo_to(root_moves)
+            self.pondering = False
+            self.stop_event = None
+
+    def stop_pondering(self, game=None):
+        """Zatrzymuje wątek pondering (jeśli działa) i raportuje, czy przewidział pozycję."""
+        if self.ponder_thread is None:
+            return
+        self.ponder_stop.set()
+        self.ponder_thread.join()
+        self.ponder_thread = None
+
+        if game is not None:
+            history = list(game.move_history)
+            hit = history[:-1] == self.ponder_history and history[-1:] == self.ponder_replies[:1]
+            print(f"🤔 Pondering: głębokość {self.ponder_depth}, "
+                  f"{'przewidziana odpowiedź' if hit else 'inna odpowiedź'}")
+
+    def parallel_search(self, game: BitBoard, best_move: int, start_time: float) -> int:
+        """Przeszukiwanie Lazy SMP w self.workers procesach (pula tworzona przy pierwszym użyciu)."""
+        if self.smp is None:
+            from parallel import LazySMP
+            self.smp = LazySMP(self, self.workers)
+        return self.smp.search(game, best_move, start_time)
+
+    def close(self):
+        """Zatrzymuje pondering, zwalnia zasoby przeszukiwania równoległego i zapisuje pamięć podręczną."""
+        self.stop_pondering()
+        if self.smp is not None:
+            self.smp.close()
+            self.smp = None
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    def get_solver(self, game: BitBoard) -> Solver:
+        """Zwraca (tworzony raz na geometrię) dokładny solver - jego TT przetrwa między ruchami."""
+        config = (game.n_rows, game.n_columns, game.winning_length)
+        if config not in self.solvers:
+            self.solvers[config] = Solver(*config, check_interval=self.check_interval,
+                                          on_interval=self.check_solver_limits)
+        return self.solvers[config]
+
+    def check_solver_limits(self, nodes: int):
+        """Kontrola limitów wywoływana przez solver (węzły solvera liczą się jak węzły silnika)."""
+        self.nodes_visited = nodes
+        self.check_limits()
+
+    def solve_endgame(self, game: BitBoard, start_time: float) -> int:
+        """
+        Wybiera ruch dokładnym solverem. Jeśli solver nie zdąży w limicie, ruch
+        wybiera płytkie przeszukiwanie heurystyczne (bez limitów, kilkaset węzłów).
+        """
+        solver = self.get_solver(game)
+        solver.reset_stats()
+        self.start_limits(start_time)
+        try:
+            move, score = solver.best_move(game)
+        except SearchAborted:
+            print("⏰ Solver przerwany (limit czasu/węzłów) - przeszukiwanie heurystyczne")
+            self.deadline = None
+            self.next_limit_check = float('inf')
+            return self.alpha_beta_with_enhancements(game, 4, float('-inf'), float('inf'), 0)[1]
+        
+        if self.cache is not None:
+            self.cache.store(game, SOLVED_DEPTH, score, move)
+        
+        moves_left = solver.score_to_distance(score, len(game.move_history))
+        outcome = "wygrana" if score > 0 else "przegrana" if score < 0 else "remis"
+        print(f"🧩 Solver: kolumna {move} - {outcome} ({moves_left} półruchów do końca)")
+        return move
+
+    def get_cache(self):
+        """Zwraca trwałą pamięć podręczną pozycji (tworzoną przy pierwszym użyciu) albo None."""
+        if self.cache is None and self.cache_path is not None:
+            from position_cache import PositionCache
+            self.cache = PositionCache(self.cache_path, self.cache_size)
+        return self.cache
+
+    def start_limits(self, start_time: float):
+        """Ustawia termin i licznik kontroli limitów dla nowego ruchu."""
+        self.deadline = start_time + self.time_limit if self.time_limit is not None else None
+        self.next_limit_check = self.check_interval
+        if self.node_limit is not None:
+            self.next_limit_check = min(self.next_limit_check, self.node_limit)
+
+    def check_limits(self):
+        """Wywoływane co check_interval węzłów - przerywa przeszukiwanie po przekroczeniu limitu."""
+        self.next_limit_check = self.nodes_visited + self.check_interval
+        if self.pondering:
+            # Pondering nie ma limitów - kończy go tylko stop_event
+            if self.stop_event.is_set():
+                raise SearchAborted()
+            return
+        if self.node_limit is not None:
+            if self.nodes_visited >= self.node_limit:
+                raise SearchAborted()
+            self.next_limit_check = min(self.next_limit_check, self.node_limit)
+        if self.deadline is not None and time.time() >= self.deadline:
+            raise SearchAborted()
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchAborted()
 
     def get_opening_move(self, game: Game, valid_moves: List[int]) -> int:
         """Zwraca najlepszy ruch z opening book."""
@@ -298,238 +697,332 @@ class UnbeatableAI:
         center = game.n_columns // 2
         return center if center in valid_moves else valid_moves[0]
 
-    def find_winning_move(self, game: Game, valid_moves: List[int]) -> Optional[int]:
-        """Znajduje ruch dający natychmiastowe zwycięstwo."""
-        for col in valid_moves:
-            if self.simulate_move_wins(game, col, game.current_player):
-                return col
-        return None
-
-    def find_blocking_move(self, game: Game, valid_moves: List[int]) -> Optional[int]:
-        """Znajduje ruch blokujący zwycięstwo przeciwnika."""
-        opponent = 1 - game.current_player
-        for col in valid_moves:
-            # Symuluj ruch przeciwnika
-            if self.simulate_move_wins(game, col, opponent):
-                return col
-        return None
+    def aspiration_search(self, game: BitBoard, depth: int,
+                          previous_score: Optional[float]) -> Tuple[float, Optional[int]]:
+        """
+        Przeszukiwanie z oknem aspiracyjnym wokół wyniku poprzedniej iteracji.
+        Jeśli wynik wypadnie poza okno, odpowiednia granica jest otwierana i
+        przeszukiwanie powtarzane.
+        """
+        if previous_score is None or abs(previous_score) >= self.WIN_THRESHOLD:
+            return self.alpha_beta_with_enhancements(game, depth, float('-inf'), float('inf'), 0)
+        
+        alpha = previous_score - self.aspiration_window
+        beta = previous_score + self.aspiration_window
+        while True:
+            score, move = self.alpha_beta_with_enhancements(game, depth, alpha, beta, 0)
+            if score <= alpha and alpha > float('-inf'):
+                alpha = float('-inf')
+            elif score >= beta and beta < float('inf'):
+                beta = float('inf')
+            else:
+                return score, move
 
-    def simulate_move_wins(self, game: Game, col: int, player: int) -> bool:
-        """Symuluje ruch i sprawdza czy daje zwycięstwo."""
-        if len(game.board[col]) >= game.n_rows:
-            return False
-        
-        # Wykonaj ruch
-        row = len(game.board[col])
-        game.board[col].append(player)
-        
-        # Sprawdź zwycięstwo
-        wins = game.check_winner_from_position(col, row, player) == player
-        
-        # Cofnij ruch
-        game.board[col].pop()
-        
-        return wins
+    def mtdf(self, game: BitBoard, depth: int,
+             first_guess: Optional[float]) -> Tuple[float, Optional[int]]:
+        """
+        MTD(f): zbiega do wartości minimax serią przeszukiwań oknem zerowym
+        (beta - 1, beta), zawężając przedział [lower, upper] wokół wyniku.
+        Powtórne przejścia korzystają z granic zapisanych w transposition table.
+        Ruch pochodzi z ostatniego przejścia zakończonego przekroczeniem beta
+        (tylko wtedy jest wiarygodny), a gdy takiego nie było - z ostatniego przejścia.
+        """
+        guess = 0 if first_guess is None else first_guess
+        lower, upper = float('-inf'), float('inf')
+        best_move = None
+        last_move = None
+        while lower < upper:
+            beta = max(guess, lower + 1)
+            guess, last_move = self.alpha_beta_with_enhancements(game, depth, beta - 1, beta, 0)
+            if guess < beta:
+                upper = guess
+            else:
+                lower = guess
+                best_move = last_move
+        if best_move is None:
+            best_move = last_move
+        return guess, best_move
 
-    def alpha_beta_with_enhancements(self, game: Game, depth: int, alpha: float, beta: float, 
-                                   maximizing_player: bool, ply: int) -> Tuple[float, Optional[int]]:
-        """Zaawansowana wersja alpha-beta z wszystkimi optymalizacjami."""
+    def alpha_beta_with_enhancements(self, game: BitBoard, depth: int, alpha: float, beta: float,
+                                     ply: int) -> Tuple[float, Optional[int]]:
+        """
+        Zaawansowana wersja alpha-beta w formie negamax z PVS (principal variation search):
+        pierwszy ruch przeszukiwany jest pełnym oknem, pozostałe oknem zerowym
+        (alpha, alpha + 1) i tylko przy przekroczeniu alpha przeszukiwane ponownie.
+        Wynik jest zawsze z perspektywy gracza na ruchu.
+        """
         self.nodes_visited += 1
-        
-        # Transposition table lookup
-        board_hash = self.hash_board(game)
-        if board_hash in self.transposition_table:
-            entry = self.transposition_table[board_hash]
-            if entry['depth'] >= depth:
-                if entry['type'] == 'exact':
-                    return entry['value'], entry['move']
-                elif entry['type'] == 'lower' and entry['value'] >= beta:
-                    return entry['value'], entry['move']
-                elif entry['type'] == 'upper' and entry['value'] <= alpha:
-                    return entry['value'], entry['move']
-        
-        # Terminal node check
+        if self.nodes_visited >= self.next_limit_check:
+            self.check_limits()
+        
+        # Transposition table lookup - klucz wspólny dla pozycji i jej odbicia
+        board_hash, mirrored = self.hash_board(game)
+        entry = self.transposition_table.probe(board_hash)
+        tt_move = None
+        if entry is not None:
+            entry_depth, entry_type, entry_value, entry_move = entry
+            if mirrored and entry_move is not None:
+                entry_move = game.mirror_column(entry_move)
+            tt_move = entry_move
+            if entry_depth >= depth:
+                if entry_type == BOUND_EXACT:
+                    return entry_value, entry_move
+                elif entry_type == BOUND_LOWER and entry_value >= beta:
+                    return entry_value, entry_move
+                elif entry_type == BOUND_UPPER and entry_value <= alpha:
+                    return entry_value, entry_move
+        elif ply <= self.cache_plies and self.cache is not None:
+            # Płytkie węzły - wynik z trwałej pamięci (bez wpisów solvera, mają inną skalę,
+            # i bez wyników wygranej / przegranej - zależą od głębokości i półruchu korzenia,
+            # z którego je zapisano); przeniesiony do TT, więc kolejne iteracje nie pytają bazy
+            cached = self.cache.probe(game)
+            if (cached is not None and depth <= cached[0] < SOLVED_DEPTH
+                    and abs(cached[1]) < self.WIN_THRESHOLD):
+                cached_depth, cached_value, cached_move = cached
+                self.store_transposition(game, board_hash, mirrored, cached_depth, cached_value,
+                                         cached_move, float('-inf'), float('inf'))
+                return cached_value, cached_move
+        
+        # Terminal node check - wygrać mógł tylko poprzedni gracz
         winner = game.check_winner()
         if winner is not None:
-            score = self.evaluate_terminal(game, winner, depth, ply)
-            return score, None
-        
-        if depth == 0 or game.is_board_full():
-            score = self.evaluate_position_advanced(game)
-            return score, None
+            return -self.evaluate_terminal(game, winner, depth, ply), None
         
-        valid_moves = self.get_valid_moves(game)
-        if not valid_moves:
+        # Martwy remis - żadna linia nie jest już otwarta dla żadnego gracza. Wynik
+        # jest dokładny dla całej reszty gry, więc wpis ma głębokość pustych pól.
+        if game.is_dead_draw():
+            remaining = game.n_rows * game.n_columns - len(game.move_history)
+            self.transposition_table.store(board_hash, remaining, BOUND_EXACT, 0, None)
             return 0, None
         
-        # Advanced move ordering
-        valid_moves = self.order_moves_advanced(game, valid_moves, ply)
-        
-        best_move = valid_moves[0]
+        if depth == 0 or game.is_board_full():
+            if depth == 0 and self.threat_extension:
+                # Rozszerzenie liścia - wymuszona wygrana gracza na ruchu samymi zagrożeniami
+                # (wynik jak dla pozycji końcowej osiągniętej forced[1] półruchów dalej)
+                forced = forced_win(game, self.threat_extension)
+                if forced is not None:
+                    return 10000 - ply - 2 * forced[1], forced[0]
+            return round(self.evaluate_position_advanced(game)), None
+        
+        # Wymuszenia: wygrana w jednym ruchu albo brak ruchu, po którym przeciwnik
+        # nie wygrywa - wynik znany bez przeszukiwania dzieci (jak w węzłach potomnych)
+        winning = game.winning_moves()
+        if winning:
+            return 10000 + depth - ply - 2, game.move_columns(winning)[0]
+        non_losing = game.non_losing_moves()
+        if not non_losing:
+            return -(10000 + depth - ply - 4), self.get_valid_moves(game)[0]
+        
+        # Pozycja symetryczna - ruchy z prawej połowy są odbiciami ruchów z lewej
+        if game.is_symmetric():
+            non_losing &= game.left_half_mask
+        
+        if depth == 1 and self.batch_leaves:
+            value, best_move = self.evaluate_last_ply(game, ply, game.move_columns(non_losing))
+            self.store_transposition(game, board_hash, mirrored, depth, value, best_move, alpha, beta)
+            return value, best_move
+        
+        # Korzeń: ruch z płytszej księgi wyprzedza ruch z TT w iteracjach nie głębszych
+        # niż księga (pochodzi z co najmniej tak głębokiego przeszukiwania)
+        if ply == 0 and self.root_hint is not None and depth <= self.root_hint[1]:
+            tt_move = self.root_hint[0]
+        
+        # Ruchy generowane etapami - po odcięciu kolejne etapy nie są liczone
+        best_move = None
+        best_value = float('-inf')
         original_alpha = alpha
         
-        if maximizing_player:
-            max_eval = float('-inf')
-            for col in valid_moves:
-                # Make move without copying
-                game.board[col].append(game.current_player)
-                game.move_history.append(col)
-                game.current_player = 1 - game.current_player
-                
-                eval_score, _ = self.alpha_beta_with_enhancements(
-                    game, depth - 1, alpha, beta, False, ply + 1
-                )
-                
-                # Undo move
-                game.undo_move(col)
-                
-                if eval_score > max_eval:
-                    max_eval = eval_score
-                    best_move = col
-                
-                alpha = max(alpha, eval_score)
-                
-                # Alpha-beta pruning with killer move update
-                if beta <= alpha:
-                    self.pruning_count += 1
-                    self.update_killer_moves(col, ply)
-                    self.history_table[(col, game.current_player)] += depth * depth
-                    break
+        for index, col in enumerate(self.generate_moves(game, ply, tt_move, non_losing)):
+            # Make move without copying
+            game.make_move(col)
             
-            # Store in transposition table
-            self.store_transposition(board_hash, depth, max_eval, best_move, original_alpha, beta)
-            return max_eval, best_move
-        else:
-            min_eval = float('inf')
-            for col in valid_moves:
-                # Make move without copying
-                game.board[col].append(game.current_player)
-                game.move_history.append(col)
-                game.current_player = 1 - game.current_player
-                
-                eval_score, _ = self.alpha_beta_with_enhancements(
-                    game, depth - 1, alpha, beta, True, ply + 1
-                )
-                
-                # Undo move
-                game.undo_move(col)
-                
-                if eval_score < min_eval:
-                    min_eval = eval_score
-                    best_move = col
-                
-                beta = min(beta, eval_score)
-                
-                if beta <= alpha:
-                    self.pruning_count += 1
-                    self.update_killer_moves(col, ply)
-                    self.history_table[(col, game.current_player)] += depth * depth
-                    break
+            if index == 0:
+                value = -self.alpha_beta_with_enhancements(game, depth - 1, -beta, -alpha, ply + 1)[0]
+            else:
+                # Okno zerowe - sprawdzamy tylko, czy ruch jest lepszy od dotychczasowego
+                value = -self.alpha_beta_with_enhancements(game, depth - 1, -alpha - 1, -alpha, ply + 1)[0]
+                if alpha < value < beta:
+                    value = -self.alpha_beta_with_enhancements(game, depth - 1, -beta, -value, ply + 1)[0]
             
-            self.store_transposition(board_hash, depth, min_eval, best_move, original_alpha, beta)
-            return min_eval, best_move
-
-    def order_moves_advanced(self, game: Game, valid_moves: List[int], ply: int) -> List[int]:
-        """Zaawansowane sortowanie ruchów."""
-        move_scores = []
-        center = game.n_columns // 2
-        
-        for col in valid_moves:
-            score = 0
+            # Undo move
+            game.undo_move(col)
             
-            # 1. Sprawdź wygrywające ruchy (najwyższy priorytet)
-            if self.simulate_move_wins(game, col, game.current_player):
-                score += 100000
+            if value > best_value:
+                best_value = value
+                best_move = col
             
-            # 2. Sprawdź blokowanie przeciwnika
-            if self.simulate_move_wins(game, col, 1 - game.current_player):
-                score += 50000
+            alpha = max(alpha, value)
             
-            # 3. Killer moves
-            if col in self.killer_moves[ply]:
-                score += 10000
+            # Alpha-beta pruning with killer move update
+            if alpha >= beta:
+                self.pruning_count += 1
+                self.update_killer_moves(col, ply)
+                self.history_table[(col, game.current_player)] += depth * depth
+                break
+        
+        # Store in transposition table
+        self.store_transposition(game, board_hash, mirrored, depth, best_value, best_move,
+                                 original_alpha, beta)
+        return best_value, best_move
+
+    def get_batch_evaluator(self, game: BitBoard):
+        """Zwraca (tworzony raz na geometrię) wektorowy ewaluator pozycji."""
+        from batch_eval import BatchEvaluator
+        
+        config = (game.n_rows, game.n_columns, game.winning_length)
+        if config not in self.batch_evaluators:
+            self.batch_evaluators[config] = BatchEvaluator(
+                *config, self.get_line_tables(game.winning_length))
+        return self.batch_evaluators[config]
+
+    def evaluate_last_ply(self, game: BitBoard, ply: int,
+                          moves: Optional[List[int]] = None) -> Tuple[float, Optional[int]]:
+        """
+        Węzeł na głębokości 1: zbiera wszystkie liście i ocenia je jednym wywołaniem
+        BatchEvaluator zamiast osobnego evaluate_position_advanced dla każdego liścia.
+        Wynik (jak w negamax) jest z perspektywy gracza na ruchu w tym węźle.
+        """
+        from batch_eval import board_to_array
+        
+        scores = {}
+        batch_moves = []
+        for col in moves if moves is not None else self.get_valid_moves(game):
+            game.make_move(col)
+            self.nodes_visited += 1
             
-            # 4. History heuristic
-            score += self.history_table.get((col, game.current_player), 0)
+            winner = game.check_winner()
+            if winner is not None:
+                scores[col] = self.evaluate_terminal(game, winner, 0, ply + 1)
+            elif game.is_dead_draw():
+                # Jak w alpha_beta_with_enhancements - martwy remis (także pełna plansza) to 0
+                scores[col] = 0
+            elif game.is_board_full():
+                scores[col] = -round(self.evaluate_position_advanced(game))
+            else:
+                batch_moves.append(col)
             
-            # 5. Kontrola środka
+            game.undo_move(col)
+        
+        if batch_moves:
+            evaluator = self.get_batch_evaluator(game)
+            children = evaluator.child_boards(board_to_array(game), batch_moves,
+                                              game.heights, game.current_player)
+            for col, score in zip(batch_moves, evaluator.evaluate(children)):
+                scores[col] = -round(float(score))
+        
+        best_move = max(scores, key=scores.get)
+        return scores[best_move], best_move
+
+    def order_moves_advanced(self, game: BitBoard, valid_moves: List[int], ply: int) -> List[int]:
+        """Pełna lista ruchów w kolejności generate_moves (ograniczona do valid_moves)."""
+        return [col for col in self.generate_moves(game, ply) if col in valid_moves]
+
+    def generate_moves(self, game: BitBoard, ply: int, tt_move: Optional[int] = None,
+                       allowed: Optional[int] = None):
+        """
+        Generator ruchów w kolejności etapów - każdy etap liczony dopiero, gdy
+        przeszukiwanie poprosi o kolejny ruch (po odcięciu reszta nie jest liczona):
+        1. ruch z transposition table,
+        2. natychmiastowe wygrane, potem blokady - z masek zagrożeń planszy bitowej,
+        3. killer moves,
+        4. pozostałe ruchy posortowane pełną oceną (historia, środek, zagrożenia, struktura).
+        allowed to opcjonalna maska dopuszczalnych ruchów (np. BitBoard.non_losing_moves).
+        """
+        # Kolumny spoza allowed traktujemy jak już zwrócone
+        played = set()
+        if allowed is not None:
+            played = set(range(game.n_columns)) - set(game.move_columns(allowed))
+        if tt_move is not None and tt_move not in played and game.can_play(tt_move):
+            played.add(tt_move)
+            yield tt_move
+        
+        # Pola, na których gracz na ruchu / przeciwnik domyka linię
+        possible = game.possible_moves(game.mask)
+        opponent_position = game.current_position ^ game.mask
+        for position in [game.current_position, opponent_position]:
+            threats = game.winning_positions(position, game.mask) & possible
+            while threats:
+                bit = threats & -threats
+                threats ^= bit
+                col = (bit.bit_length() - 1) // game.column_height
+                if col not in played:
+                    played.add(col)
+                    yield col
+        
+        if ply < len(self.killer_moves):
+            for col in list(self.killer_moves[ply]):
+                if col not in played and game.can_play(col):
+                    played.add(col)
+                    yield col
+        
+        center = game.n_columns // 2
+        move_scores = []
+        for col in range(game.n_columns):
+            if col in played or not game.can_play(col):
+                continue
+            score = self.history_table.get((col, game.current_player), 0)
             score += (center - abs(col - center)) * 100
-            
-            # 6. Analiza zagrożeń (threats)
             score += self.analyze_column_threats(game, col)
-            
-            # 7. Pozycyjne preferencje
             score += self.evaluate_column_structure(game, col)
-            
+            if self.order_jitter:
+                # Zaburzenie kolejności (procesy pomocnicze Lazy SMP)
+                score += self.order_rng.randrange(self.order_jitter)
             move_scores.append((score, col))
         
         # Sortuj malejąco
         move_scores.sort(reverse=True)
-        return [col for _, col in move_scores]
+        for _, col in move_scores:
+            yield col
 
-    def analyze_column_threats(self, game: Game, col: int) -> float:
-        """Analizuje zagrożenia w kolumnie."""
-        if len(game.board[col]) >= game.n_rows:
+    def analyze_column_threats(self, game: BitBoard, col: int) -> float:
+        """Analizuje zagrożenia w kolumnie (pionek gracza na ruchu na najniższym wolnym polu)."""
+        if game.heights[col] >= game.n_rows:
             return -1000  # Pełna kolumna
         
         score = 0
-        row = len(game.board[col])
-        
-        # Symuluj postawienie pionka
-        game.board[col].append(game.current_player)
+        row = game.heights[col]
+        position = game.current_position
+        opponent_position = game.current_position ^ game.mask
         
         # Sprawdź wszystkie kierunki dla potencjalnych zagrożeń
         directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
         
         for dx, dy in directions:
             # Zlicz pionki gracza w tym kierunku
-            count = self.count_in_direction(game, col, row, dx, dy, game.current_player)
+            count = self.count_in_direction(game, col, row, dx, dy, position)
             if count >= 2:
                 score += count * 50
             
             # Zlicz zagrożenia przeciwnika
-            opp_count = self.count_in_direction(game, col, row, dx, dy, 1 - game.current_player)
+            opp_count = self.count_in_direction(game, col, row, dx, dy, opponent_position)
             if opp_count >= 2:
                 score += opp_count * 30
         
-        # Cofnij symulację
-        game.board[col].pop()
-        
         return score
 
-    def count_in_direction(self, game: Game, start_col: int, start_row: int, 
-                          dx: int, dy: int, player: int) -> int:
-        """Liczy pionki gracza w danym kierunku."""
+    def count_in_direction(self, game: BitBoard, start_col: int, start_row: int, 
+                          dx: int, dy: int, position: int) -> int:
+        """Liczy kolejne pionki maski position w obie strony kierunku od pola startowego."""
         count = 1  # Początkowy pionek
         
         # Sprawdź w jedną stronę
         for i in range(1, game.winning_length):
-            col = start_col + i * dx
-            row = start_row + i * dy
-            if not self.is_valid_and_player(game, col, row, player):
+            if not game.has_piece(position, start_col + i * dx, start_row + i * dy):
                 break
             count += 1
         
         # Sprawdź w drugą stronę
         for i in range(1, game.winning_length):
-            col = start_col - i * dx
-            row = start_row - i * dy
-            if not self.is_valid_and_player(game, col, row, player):
+            if not game.has_piece(position, start_col - i * dx, start_row - i * dy):
                 break
             count += 1
         
         return count
 
-    def is_valid_and_player(self, game: Game, col: int, row: int, player: int) -> bool:
-        """Sprawdza czy pozycja jest prawidłowa i zawiera pionek gracza."""
-        return (0 <= col < game.n_columns and 
-                0 <= row < len(game.board[col]) and
-                game.board[col][row] == player)
-
-    def evaluate_column_structure(self, game: Game, col: int) -> float:
+    def evaluate_column_structure(self, game: BitBoard, col: int) -> float:
         """Ocenia strukturę kolumny."""
         score = 0
-        height = len(game.board[col])
+        height = game.heights[col]
         
         # Preferuj niższe pozycje
         score += (game.n_rows - height) * 10
@@ -539,7 +1032,7 @@ class UnbeatableAI:
             # Sprawdź sąsiednie kolumny
             for neighbor in [col - 1, col + 1]:
                 if 0 <= neighbor < game.n_columns:
-                    neighbor_height = len(game.board[neighbor])
+                    neighbor_height = game.heights[neighbor]
                     height_diff = abs(height - neighbor_height)
                     if height_diff > 2:
                         score -= 20  # Kara za duże różnice wysokości
@@ -554,37 +1047,29 @@ class UnbeatableAI:
                 if len(self.killer_moves[ply]) > 2:  # Zachowaj tylko 2 najlepsze
                     self.killer_moves[ply].pop(0)
 
-    def store_transposition(self, board_hash: str, depth: int, value: float, 
-                          best_move: int, alpha: float, beta: float):
-        """Zapisuje pozycję w transposition table."""
-        entry_type = 'exact'
+    def store_transposition(self, game: BitBoard, board_hash: int, mirrored: bool, depth: int,
+                            value: float, best_move: int, alpha: float, beta: float):
+        """Zapisuje pozycję w transposition table (ruch w układzie pozycji kanonicznej)."""
+        entry_type = BOUND_EXACT
         if value <= alpha:
-            entry_type = 'upper'
+            entry_type = BOUND_UPPER
         elif value >= beta:
-            entry_type = 'lower'
+            entry_type = BOUND_LOWER
         
-        self.transposition_table[board_hash] = {
-            'depth': depth,
-            'value': value,
-            'move': best_move,
-            'type': entry_type
-        }
-        
-        # Ogranicz rozmiar tabeli
-        if len(self.transposition_table) > 100000:
-            # Usuń 25% najstarszych wpisów
-            items = list(self.transposition_table.items())
-            self.transposition_table = dict(items[25000:])
+        if mirrored and best_move is not None:
+            best_move = game.mirror_column(best_move)
+        self.transposition_table.store(board_hash, depth, entry_type, value, best_move)
 
-    def hash_board(self, game: Game) -> str:
-        """Szybka funkcja hash planszy."""
-        # Używamy tuple dla lepszej wydajności
-        board_tuple = tuple(tuple(col) for col in game.board)
-        return str(hash((board_tuple, game.current_player)))
+    def hash_board(self, game: BitBoard) -> Tuple[int, bool]:
+        """
+        Zwraca kanoniczny klucz Zobrista planszy i informację, czy jest to klucz
+        odbicia lustrzanego (BitBoard.canonical_hash).
+        """
+        return game.canonical_hash()
 
-    def get_valid_moves(self, game: Game) -> List[int]:
+    def get_valid_moves(self, game: BitBoard) -> List[int]:
         """Zwraca listę dostępnych kolumn."""
-        return [col for col in range(game.n_columns) if len(game.board[col]) < game.n_rows]
+        return [col for col in range(game.n_columns) if game.heights[col] < game.n_rows]
 
     def evaluate_terminal(self, game: Game, winner: int, depth: int, ply: int) -> float:
         """Ocenia pozycję końcową."""
@@ -626,70 +1111,98 @@ class UnbeatableAI:
         
         return score
 
-    def evaluate_center_control(self, game: Game, player: int) -> float:
+    def evaluate_center_control(self, game: BitBoard, player: int) -> float:
         """Ocenia kontrolę nad środkiem planszy."""
         score = 0
-        center = game.n_columns // 2
+        position = game.player_mask(player)
         
-        # Główna kolumna środkowa
-        for piece in game.board[center]:
-            if piece == player:
-                score += 5
-        
-        # Kolumny blisko środka
-        for offset in [1, 2]:
-            for col in [center - offset, center + offset]:
-                if 0 <= col < game.n_columns:
-                    weight = 3 / offset  # Im dalej od środka, tym mniejsza waga
-                    for piece in game.board[col]:
-                        if piece == player:
-                            score += weight
+        # Pionki liczone razem dla kolumn o tej samej wadze
+        for weight, mask in self.get_eval_masks(game)[0]:
+            score += weight * game.count_pieces(position, mask)
         
         return score
 
-    def evaluate_winning_patterns(self, game: Game, player: int) -> float:
-        """Ocenia wzorce wygrywające."""
+    def get_eval_masks(self, game: BitBoard) -> Tuple[List[Tuple[float, int]], List[Tuple[float, int]]]:
+        """
+        Zwraca (tworzone raz na geometrię) listy (waga, maska pól) dla oceny pozycji:
+        kontroli środka (kolumny o tej samej wadze) i premii za niskie pozycje - premia
+        (n_rows - row) * 0.5 rozłożona na bity liczby n_rows - row.
+        """
+        config = (game.n_rows, game.n_columns)
+        if config not in self.eval_masks:
+            center_weights = {}
+            for col in range(game.n_columns):
+                # Odległość od środka symetryczna względem odbicia - przy parzystej liczbie
+                # kolumn obie środkowe kolumny mają odległość 0
+                offset = abs(2 * col - (game.n_columns - 1)) // 2
+                if offset == 0:
+                    weight = 5  # Główna kolumna środkowa
+                elif offset <= 2:
+                    weight = 3 / offset  # Im dalej od środka, tym mniejsza waga
+                else:
+                    continue
+                center_weights[weight] = center_weights.get(weight, 0) | game.column_mask(col)
+            
+            height_masks = []
+            for bit in range(game.n_rows.bit_length()):
+                mask = 0
+                for row in range(game.n_rows):
+                    if (game.n_rows - row) >> bit & 1:
+                        mask |= game.bottom_mask << row
+                height_masks.append((0.5 * (1 << bit), mask))
+            
+            self.eval_masks[config] = (list(center_weights.items()), height_masks)
+        return self.eval_masks[config]
+
+    def get_line_tables(self, winning_length: int) -> List[List[float]]:
+        """
+        Zwraca tablice ocen okien indeksowane kodem trójkowym okna (patterns.encode_window):
+        [wzorce gracza 0, wzorce gracza 1, zagrożenia gracza 0, zagrożenia gracza 1].
+        """
+        if winning_length not in self.line_tables:
+            self.line_tables[winning_length] = (
+                build_window_table(winning_length, self.evaluate_window_advanced) +
+                build_window_table(winning_length, self.evaluate_window_threat))
+        return self.line_tables[winning_length]
+
+    def evaluate_window_threat(self, window: List, player: int) -> float:
+        """Wartość zagrożenia okna - brakuje jednego lub dwóch pionków, przeciwnik go nie blokuje."""
+        player_count = window.count(player)
+        if player_count == 0 or window.count(1 - player) > 0:
+            return 0
+        if player_count == len(window) - 1:
+            return 100   # Bezpośrednie zagrożenie
+        if player_count == len(window) - 2:
+            return 20    # Potencjalne zagrożenie
+        return 0
+
+    def evaluate_winning_patterns(self, game: BitBoard, player: int) -> float:
+        """Ocenia wzorce wygrywające - suma utrzymywana przyrostowo przez BitBoard."""
+        return game.line_totals[player]
+
+    def evaluate_winning_patterns_full(self, game: Game, player: int) -> float:
+        """Ocenia wzorce wygrywające przeliczając całą planszę (do weryfikacji)."""
         score = 0
-        win_len = game.winning_length
+        line_index = get_line_index(game.n_rows, game.n_columns, game.winning_length)
+        window_table = self.get_line_tables(game.winning_length)[player]
         
-        # Dla każdej możliwej linii wygrywającej
-        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
-        
-        for row in range(game.n_rows):
-            for col in range(game.n_columns):
-                for dx, dy in directions:
-                    if self.can_form_line(game, col, row, dx, dy, win_len):
-                        window = self.get_line_window(game, col, row, dx, dy, win_len)
-                        score += self.evaluate_window_advanced(window, player)
+        # Dla każdej możliwej linii wygrywającej - ocena okna to jeden odczyt z tablicy
+        for cells in line_index.lines:
+            window = self.get_line_window(game, cells)
+            score += window_table[encode_window(window)]
         
         return score
 
-    def can_form_line(self, game: Game, start_col: int, start_row: int, 
-                     dx: int, dy: int, length: int) -> bool:
-        """Sprawdza czy można utworzyć linię o danej długości."""
-        end_col = start_col + (length - 1) * dx
-        end_row = start_row + (length - 1) * dy
-        
-        return (0 <= end_col < game.n_columns and 
-                0 <= end_row < game.n_rows)
-
-    def get_line_window(self, game: Game, start_col: int, start_row: int,
-                       dx: int, dy: int, length: int) -> List:
-        """Pobiera okno linii."""
-        window = []
-        for i in range(length):
-            col = start_col + i * dx
-            row = start_row + i * dy
-            
-            if len(game.board[col]) > row:
-                window.append(game.board[col][row])
-            else:
-                window.append(None)  # Puste pole
-        
-        return window
+    def get_line_window(self, game: Game, cells) -> List:
+        """Pobiera okno linii (None oznacza puste pole)."""
+        board = game.board
+        return [board[col][row] if len(board[col]) > row else None for col, row in cells]
 
     def evaluate_window_advanced(self, window: List, player: int) -> float:
-        """Zaawansowana ocena okna."""
+        """
+        Zaawansowana ocena okna dowolnej długości. W przeszukiwaniu używana tylko do
+        zbudowania tablicy ocen (get_line_tables) - same okna oceniane są odczytem z tablicy.
+        """
         score = 0
         opponent = 1 - player
         
@@ -702,17 +1215,17 @@ class UnbeatableAI:
             return 0
         
         # Ocena na podstawie wzorców
-        if player_count == 4:
+        if player_count == len(window):
             score += 10000  # Wygrana
-        elif player_count == 3 and empty_count == 1:
+        elif empty_count == 1:
             score += 500    # Zagrożenie
-        elif player_count == 2 and empty_count == 2:
+        elif empty_count == 2 and player_count >= 2:
             # Sprawdź rozkład pustych pól
             if self.is_open_window(window):
                 score += 50   # Otwarte okno
             else:
                 score += 10   # Zamknięte okno
-        elif player_count == 1 and empty_count == 3:
+        elif player_count >= 1:
             score += 1      # Początek formacji
         
         return score
@@ -723,107 +1236,40 @@ class UnbeatableAI:
             return False
         return window[0] is None or window[-1] is None
 
-    def evaluate_board_structure(self, game: Game, player: int) -> float:
+    def evaluate_board_structure(self, game: BitBoard, player: int) -> float:
         """Ocenia strukturę planszy."""
         score = 0
+        position = game.player_mask(player)
         
-        # Preferuj niskie pozycje (stabilniejsze)
-        for col in range(game.n_columns):
-            for row, piece in enumerate(game.board[col]):
-                if piece == player:
-                    height_bonus = (game.n_rows - row) * 0.5
-                    score += height_bonus
+        # Preferuj niskie pozycje (stabilniejsze) - premia (n_rows - row) * 0.5 za pionek
+        for height_bonus, mask in self.get_eval_masks(game)[1]:
+            score += height_bonus * game.count_pieces(position, mask)
         
         # Preferuj równomierny rozkład pionków
+        heights = game.heights
         for col in range(game.n_columns - 1):
-            height_diff = abs(len(game.board[col]) - len(game.board[col + 1]))
+            height_diff = abs(heights[col] - heights[col + 1])
             if height_diff > 2:
                 score -= 5  # Kara za nierównomierność
         
         return score
 
-    def evaluate_threats(self, game: Game, player: int) -> float:
-        """Ocenia zagrożenia i możliwości."""
-        score = 0
-        
-        # Sprawdź wszystkie pozycje gdzie gracz może postawić pionek
-        for col in range(game.n_columns):
-            if len(game.board[col]) < game.n_rows:
-                row = len(game.board[col])
-                
-                # Symuluj postawienie pionka
-                game.board[col].append(player)
-                
-                # Sprawdź czy tworzy zagrożenia
-                threat_level = self.analyze_position_threats(game, col, row, player)
-                score += threat_level
-                
-                # Cofnij symulację
-                game.board[col].pop()
-        
-        return score
-
-    def analyze_position_threats(self, game: Game, col: int, row: int, player: int) -> float:
-        """Analizuje zagrożenia z danej pozycji."""
-        score = 0
-        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
-        
-        for dx, dy in directions:
-            # Sprawdź linie w obu kierunkach
-            line_strength = self.calculate_line_strength(game, col, row, dx, dy, player)
-            
-            if line_strength >= game.winning_length:
-                score += 1000  # Natychmiastowe zwycięstwo
-            elif line_strength == game.winning_length - 1:
-                score += 100   # Bezpośrednie zagrożenie
-            elif line_strength == game.winning_length - 2:
-                score += 20    # Potencjalne zagrożenie
-            else:
-                score += line_strength  # Podstawowa wartość
-        
-        return score
-
-    def calculate_line_strength(self, game: Game, col: int, row: int, 
-                               dx: int, dy: int, player: int) -> int:
-        """Oblicza siłę linii w danym kierunku."""
-        count = 1  # Aktualny pionek
-        
-        # Sprawdź w jedną stronę
-        for i in range(1, game.winning_length):
-            new_col = col + i * dx
-            new_row = row + i * dy
-            if (0 <= new_col < game.n_columns and 
-                0 <= new_row < len(game.board[new_col]) and
-                game.board[new_col][new_row] == player):
-                count += 1
-            else:
-                break
-        
-        # Sprawdź w drugą stronę
-        for i in range(1, game.winning_length):
-            new_col = col - i * dx
-            new_row = row - i * dy
-            if (0 <= new_col < game.n_columns and 
-                0 <= new_row < len(game.board[new_col]) and
-                game.board[new_col][new_row] == player):
-                count += 1
-            else:
-                break
-        
-        return count
+    def evaluate_threats(self, game: BitBoard, player: int) -> float:
+        """Ocenia zagrożenia - liczba linii bliskich ukończenia, utrzymywana przez BitBoard."""
+        return game.line_totals[2 + player]
 
-    def evaluate_mobility(self, game: Game, player: int) -> float:
+    def evaluate_mobility(self, game: BitBoard, player: int) -> float:
         """Ocenia mobilność gracza."""
         mobility = 0
         
         # Liczba dostępnych kolumn
         available_columns = sum(1 for col in range(game.n_columns) 
-                               if len(game.board[col]) < game.n_rows)
+                               if game.heights[col] < game.n_rows)
         mobility += available_columns * 2
         
         # Ocena jakości dostępnych ruchów
         for col in range(game.n_columns):
-            if len(game.board[col]) < game.n_rows:
+            if game.heights[col] < game.n_rows:
                 # Dodaj bonus za ruchy w środku planszy
                 center_distance = abs(col - game.n_columns // 2)
                 mobility += (game.n_columns - center_distance) * 0.5
@@ -838,12 +1284,19 @@ class UnbeatableAI:
         print(f"🔍 Odwiedzone węzły: {self.nodes_visited:,}")
         print(f"✂️  Przycinania α-β: {self.pruning_count:,}")
         print(f"⏱️  Czas przeszukiwania: {self.search_time:.3f}s")
-        print(f"🏆 Transposition table: {len(self.transposition_table):,} wpisów")
+        table = self.transposition_table
+        print(f"🏆 Transposition table: {len(table):,} wpisów "
+              f"({table.fill_level() * 100:.1f}% z {table.size_mb} MB)")
+        print(f"🎯 Trafienia w TT: {table.hit_rate() * 100:.1f}%")
         
         if self.search_time > 0:
             nodes_per_second = self.nodes_visited / self.search_time
             print(f"⚡ Węzłów/sekundę: {nodes_per_second:,.0f}")
         
+        if self.cache is not None:
+            print(f"💾 Pamięć podręczna pozycji: {self.cache.hits:,} trafień "
+                  f"z {self.cache.probes:,} zapytań")
+        
         pruning_efficiency = (self.pruning_count / max(self.nodes_visited, 1)) * 100
         print(f"📊 Skuteczność przycinania: {pruning_efficiency:.1f}%")
         print("="*60)
@@ -888,6 +1341,7 @@ class SimpleAI:
     """Prosty AI do testów i porównań."""
     
     def __init__(self, depth: int = 6):
+        self.config = {'depth': depth}
         self.team_name = f"Simple AI (depth {depth})"
         self.team_members = ["Basic Bot"]
         self.max_depth = depth
@@ -895,6 +1349,7 @@ class SimpleAI:
 
     def make_move(self, game: Game) -> int:
         """Zwraca ruch używając prostego minimax."""
+        game = BitBoard.from_game(game)
         valid_moves = self.get_valid_moves(game)
         if not valid_moves:
             return 0
@@ -923,6 +1378,10 @@ class SimpleAI:
         if depth == 0 or game.is_terminal():
             return self.evaluate_simple(game), None
         
+        # Żaden gracz nie może już ułożyć linii - remis bez dalszego przeszukiwania
+        if game.is_dead_draw():
+            return 0, None
+        
         valid_moves = self.get_valid_moves(game)
         if not valid_moves:
             return 0, None
@@ -932,9 +1391,7 @@ class SimpleAI:
         if maximizing:
             max_eval = float('-inf')
             for col in valid_moves:
-                game.board[col].append(game.current_player)
-                game.move_history.append(col)
-                game.current_player = 1 - game.current_player
+                game.make_move(col)
                 
                 eval_score, _ = self.minimax(game, depth - 1, False)
                 
@@ -948,9 +1405,7 @@ class SimpleAI:
         else:
             min_eval = float('inf')
             for col in valid_moves:
-                game.board[col].append(game.current_player)
-                game.move_history.append(col)
-                game.current_player = 1 - game.current_player
+                game.make_move(col)
                 
                 eval_score, _ = self.minimax(game, depth - 1, True)
                 
@@ -962,7 +1417,7 @@ class SimpleAI:
             
             return min_eval, best_move
 
-    def evaluate_simple(self, game: Game) -> float:
+    def evaluate_simple(self, game: BitBoard) -> float:
         """Prosta funkcja ewaluacyjna."""
         winner = game.check_winner()
         if winner == game.current_player:
@@ -972,33 +1427,21 @@ class SimpleAI:
         
         # Podstawowa ocena pozycji
         score = 0
-        center = game.n_columns // 2
+        center = game.column_mask(game.n_columns // 2)
         
         # Bonus za środek
-        for piece in game.board[center]:
-            if piece == game.current_player:
-                score += 3
-            else:
-                score -= 3
+        score += game.count_pieces(game.current_position, center) * 3
+        score -= game.count_pieces(game.current_position ^ game.mask, center) * 3
         
         return score
 
-    def get_valid_moves(self, game: Game) -> List[int]:
+    def get_valid_moves(self, game: BitBoard) -> List[int]:
         """Zwraca dostępne ruchy."""
-        return [col for col in range(game.n_columns) if len(game.board[col]) < game.n_rows]
+        return [col for col in range(game.n_columns) if game.heights[col] < game.n_rows]
 
     def simulate_move_wins(self, game: Game, col: int, player: int) -> bool:
         """Sprawdza czy ruch daje zwycięstwo."""
-        if len(game.board[col]) >= game.n_rows:
-            return False
-        
-        row = len(game.board[col])
-        game.board[col].append(player)
-        
-        wins = game.check_winner_from_position(col, row, player) == player
-        
-        game.board[col].pop()
-        return wins
+        return game.is_winning_move(col, player)
 
 class GameManager:
     """Menedżer gier i turniejów."""
@@ -1022,76 +1465,86 @@ class GameManager:
         start_time = time.time()
         move_count = 0
         
-        while not game.is_terminal():
-            current_player_obj = players[game.current_player]
+        try:
+            while not game.is_terminal():
+                current_player_obj = players[game.current_player]
             
-            try:
-                move = current_player_obj.make_move(game)
+                try:
+                    move = current_player_obj.make_move(game)
                 
-                if move == -1:  # Rezygnacja
-                    winner = 1 - game.current_player
-                    result = {
-                        'winner': winner,
-                        'reason': 'resignation',
-                        'moves': move_count,
-                        'time': time.time() - start_time,
-                        'player1': player1.team_name,
-                        'player2': player2.team_name
-                    }
-                    print(f"🏆 {players[winner].team_name} wygrywa przez rezygnację!")
-                    return result
-                
-                if game.make_move(move):
-                    move_count += 1
-                    
-                    # Sprawdź zwycięstwo
-                    winner = game.check_winner()
-                    if winner is not None:
-                        game.print_board()
+                    if move == -1:  # Rezygnacja
+                        winner = 1 - game.current_player
                         result = {
                             'winner': winner,
-                            'reason': 'victory',
+                            'reason': 'resignation',
                             'moves': move_count,
                             'time': time.time() - start_time,
                             'player1': player1.team_name,
                             'player2': player2.team_name
                         }
-                        print(f"🏆 {players[winner].team_name} wygrywa!")
+                        print(f"🏆 {players[winner].team_name} wygrywa przez rezygnację!")
                         return result
+
+                    if game.make_move(move):
+                        move_count += 1
                     
-                    # Sprawdź remis
-                    if game.is_board_full():
-                        game.print_board()
-                        result = {
-                            'winner': None,
-                            'reason': 'draw',
-                            'moves': move_count,
-                            'time': time.time() - start_time,
-                            'player1': player1.team_name,
-                            'player2': player2.team_name
-                        }
-                        print("🤝 Remis!")
-                        return result
-                else:
-                    print("❌ Nieprawidłowy ruch!")
+                        # Sprawdź zwycięstwo
+                        winner = game.check_winner()
+                        if winner is not None:
+                            game.print_board()
+                            result = {
+                                'winner': winner,
+                                'reason': 'victory',
+                                'moves': move_count,
+                                'time': time.time() - start_time,
+                                'player1': player1.team_name,
+                                'player2': player2.team_name
+                            }
+                            print(f"🏆 {players[winner].team_name} wygrywa!")
+                            return result
+
+                        # Sprawdź remis
+                        if game.is_board_full():
+                            game.print_board()
+                            result = {
+                                'winner': None,
+                                'reason': 'draw',
+                                'moves': move_count,
+                                'time': time.time() - start_time,
+                                'player1': player1.team_name,
+                                'player2': player2.team_name
+                            }
+                            print("🤝 Remis!")
+                            return result
+                    else:
+                        print("❌ Nieprawidłowy ruch!")
                     
-            except Exception as e:
-                print(f"❌ Błąd gracza {current_player_obj.team_name}: {e}")
-                winner = 1 - game.current_player
-                result = {
-                    'winner': winner,
-                    'reason': 'error',
-                    'moves': move_count,
-                    'time': time.time() - start_time,
-                    'player1': player1.team_name,
-                    'player2': player2.team_name
-                }
-                print(f"🏆 {players[winner].team_name} wygrywa przez błąd przeciwnika!")
-                return result
+                except Exception as e:
+                    print(f"❌ Błąd gracza {current_player_obj.team_name}: {e}")
+                    winner = 1 - game.current_player
+                    result = {
+                        'winner': winner,
+                        'reason': 'error',
+                        'moves': move_count,
+                        'time': time.time() - start_time,
+                        'player1': player1.team_name,
+                        'player2': player2.team_name
+                    }
+                    print(f"🏆 {players[winner].team_name} wygrywa przez błąd przeciwnika!")
+                    return result
+        finally:
+            # Koniec gry - silniki przestają przeszukiwać w tle
+            for player in players:
+                if hasattr(player, 'stop_pondering'):
+                    player.stop_pondering()
 
     def run_tournament(self, players: List, rounds: int = 1, 
-                      game_configs: List[Dict] = None) -> Dict:
-        """Organizuje turniej."""
+                      game_configs: List[Dict] = None, parallel: bool = False,
+                      max_workers: Optional[int] = None, seed: int = 0) -> Dict:
+        """
+        Organizuje turniej. W trybie parallel gry są rozgrywane w puli procesów
+        (run_games_parallel) - każdy proces tworzy silniki od nowa z ich config.
+        """
         if game_configs is None:
             game_configs = [{'rows': 7, 'columns': 7, 'winning_length': 4}]
         
@@ -1102,6 +1555,16 @@ class GameManager:
         standings = {player.team_name: {'wins': 0, 'draws': 0, 'losses': 0, 'points': 0} 
                     for player in players}
         
+        if parallel:
+            results = self.run_games_parallel(players, rounds, game_configs, standings,
+                                              max_workers, seed)
+            self.print_tournament_results(standings, results)
+            return {
+                'standings': standings,
+                'games': results,
+                'total_games': len(results)
+            }
+        
         for round_num in range(rounds):
             print(f"\n📅 RUNDA {round_num + 1}/{rounds}")
             print("-" * 40)
@@ -1129,6 +1592,42 @@ class GameManager:
             'total_games': len(results)
         }
 
+    def run_games_parallel(self, players: List, rounds: int, game_configs: List[Dict],
+                           standings: Dict, max_workers: Optional[int], seed: int) -> List[Dict]:
+        """
+        Rozgrywa wszystkie gry turnieju (pary x kolory x konfiguracje x rundy) w
+        ProcessPoolExecutor. Każda gra dostaje deterministyczne ziarno wyliczone z
+        seed i jej numeru w harmonogramie; wyniki są doliczane do standings w
+        kolejności zakończenia.
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        specs = [engine_spec(player) for player in players]
+        schedule = []
+        for round_num in range(rounds):
+            for i in range(len(players)):
+                for j in range(i + 1, len(players)):
+                    for config in game_configs:
+                        schedule.append((i, j, config))
+                        schedule.append((j, i, config))
+        
+        print(f"⚙️ {len(schedule)} gier w puli procesów")
+        results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(play_tournament_game, specs[i], specs[j], config,
+                                       seed * len(schedule) + game_number)
+                       for game_number, (i, j, config) in enumerate(schedule)]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                self.update_standings(standings, result)
+                
+                winner = ('remis' if result['winner'] is None else
+                          result['player1'] if result['winner'] == 0 else result['player2'])
+                print(f"[{len(results)}/{len(schedule)}] {result['player1']} vs "
+                      f"{result['player2']} ({result['config']}): {winner}")
+        return results
+
     def update_standings(self, standings: Dict, result: Dict):
         """Aktualizuje tabelę wyników."""
         player1_name = result['player1']
@@ -1176,6 +1675,36 @@ class GameManager:
         print(f"Średni czas gry: {avg_time:.2f}s")
         print("="*80)
 
+def engine_spec(player) -> Tuple[type, Dict]:
+    """Zwraca (klasa, argumenty konstruktora) pozwalające odtworzyć silnik w innym procesie."""
+    if not hasattr(player, 'config'):
+        raise ValueError(f"Gracza {player.team_name} nie można odtworzyć w innym procesie")
+    return type(player), dict(player.config)
+
+
+def play_tournament_game(spec1: Tuple[type, Dict], spec2: Tuple[type, Dict],
+                         game_config: Dict, game_seed: int) -> Dict:
+    """Rozgrywa jedną grę turnieju w procesie roboczym (silniki tworzone od nowa)."""
+    import contextlib
+    import io
+    
+    random.seed(game_seed)
+    player1 = spec1[0](**spec1[1])
+    player2 = spec2[0](**spec2[1])
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = GameManager().play_single_game(player1, player2, game_config)
+    finally:
+        for player in [player1, player2]:
+            if hasattr(player, 'close'):
+                player.close()
+    
+    result['config'] = (f"{game_config['rows']}x{game_config['columns']}/"
+                        f"{game_config['winning_length']}")
+    result['seed'] = game_seed
+    return result
+
+
 def main():
     """Główna funkcja programu."""
     print("🎮 CONNECT 4 Z GRAWITACJĄ")
@@ -1194,7 +1723,7 @@ def main():
         
         if choice == '1':
             human = HumanPlayer()
-            ai = UnbeatableAI(max_depth=10)
+            ai = UnbeatableAI(max_depth=10, ponder='expected')
             manager = GameManager()
             
             # Wybór kto zaczyna
@@ -1229,6 +1758,7 @@ def main():
             # Tworzenie graczy
             players = [
                 UnbeatableAI(max_depth=8),
+                UnbeatableAI(max_depth=8, search_driver='mtdf'),
                 UnbeatableAI(max_depth=6),
                 SimpleAI(depth=8),
                 SimpleAI(depth=6)
@@ -1242,7 +1772,8 @@ def main():
             ]
             
             manager = GameManager()
-            tournament_results = manager.run_tournament(players, rounds=1, game_configs=configs)
+            tournament_results = manager.run_tournament(players, rounds=1, game_configs=configs,
+                                                        parallel=True)
             
         elif choice == '5':
             print("\n⚙️ KONFIGURACJA PLANSZY")
@@ -1255,7 +1786,7 @@ def main():
                     config = {'rows': rows, 'columns': cols, 'winning_length': win_len}
                     
                     human = HumanPlayer()
-                    ai = UnbeatableAI(max_depth=8)
+                    ai = UnbeatableAI(max_depth=8, ponder='expected')
                     manager = GameManager()
                     
                     manager.play_single_game(human, ai, config)
@@ -0,0 +1,25 @@
+import sqlite3
+
+from bitboard import BitBoard
+from position_cache import PositionCache
+from test2 import Game, UnbeatableAI
+
+
+def test_node_limited_search_stores_root_key(tmp_path):
+    """Wynik przerwanego (limit węzłów) przeszukiwania trafia pod klucz pozycji korzenia."""
+    path = str(tmp_path / 'positions.sqlite')
+    game = Game(6, 7, 4)
+    for col in [3, 3, 3, 4, 2, 2]:
+        game.make_move(col)
+    root = BitBoard.from_game(game)
+
+    engine = UnbeatableAI(max_depth=10, time_limit=None, node_limit=3000, use_book=False,
+                          solver_threshold=None, cache_path=path)
+    move = engine.make_move(game)
+    engine.close()
+
+    rows = sqlite3.connect(path).execute(
+        "SELECT key, n_rows, n_columns, winning_length, move FROM positions").fetchall()
+    row_key, mirrored = PositionCache(path).row_key(root)
+    stored_move = root.mirror_column(move) if mirrored else move
+    assert rows == [(*row_key, stored_move)]
@@ -0,0 +1,66 @@
+from typing import Optional, Tuple
+
+from bitboard import BitBoard
+
+
+def forced_win(board: BitBoard, max_threats: int = 8,
+               position: Optional[int] = None, mask: Optional[int] = None) -> Optional[Tuple[int, int]]:
+    """
+    Wąskie przeszukiwanie przestrzeni zagrożeń (threat-space search) dla gracza na ruchu.
+
+    Atakujący gra wyłącznie ruchy tworzące natychmiastowe zagrożenie (grywalne pole
+    domykające jego linię), więc obrońca ma dokładnie jedną odpowiedź - blokadę.
+    Sekwencja kończy się wygraną, gdy atakujący ma wygrywający ruch albo stworzy
+    dwa grywalne zagrożenia naraz. Jeśli obrońca może wygrać pierwszy, ruch jest
+    pomijany; gdy blokując stworzy własne zagrożenie, atakujący musi je zablokować.
+
+    position / mask pozwalają badać pozycję inną niż bieżąca planszy (board
+    dostarcza wtedy tylko geometrii). Zwraca (pierwszy ruch, liczba półruchów do
+    wygranej włącznie z wygrywającym) albo None, jeśli nie znaleziono wymuszonej
+    wygranej w max_threats zagrożeniach.
+    """
+    if position is None:
+        position, mask = board.current_position, board.mask
+    return attack(board, position, mask, max_threats)
+
+
+def attack(board: BitBoard, position: int, mask: int, threats_left: int) -> Optional[Tuple[int, int]]:
+    """Krok atakującego w forced_win (position - jego pionki, atakujący na ruchu)."""
+    winning_positions = board.winning_positions
+    possible = board.possible_moves(mask)
+    winning = winning_positions(position, mask) & possible
+    if winning:
+        return board.move_columns(winning & -winning)[0], 1
+    if threats_left == 0:
+        return None
+
+    # Zagrożenie obrońcy trzeba zablokować; nie gramy pod jego polem wygrywającym
+    opponent = position ^ mask
+    opponent_win = winning_positions(opponent, mask)
+    candidates = possible
+    if possible & opponent_win:
+        candidates = possible & opponent_win
+        if candidates & (candidates - 1):
+            return None
+    candidates &= ~(opponent_win >> 1)
+
+    for col in board.move_columns(candidates):
+        move = candidates & board.column_mask(col)
+        new_position = position | move
+        new_mask = mask | move
+        new_possible = board.possible_moves(new_mask)
+
+        threats = winning_positions(new_position, new_mask) & new_possible
+        if not threats:
+            continue
+        # Pola wygrywające obrońcy się nie zmieniają (poza zajętym właśnie polem)
+        if opponent_win & new_possible & ~move:
+            continue
+        if threats & (threats - 1):
+            # Dwa grywalne zagrożenia - obrońca zablokuje najwyżej jedno
+            return col, 3
+
+        result = attack(board, new_position, new_mask | threats, threats_left - 1)
+        if result is not None:
+            return col, result[1] + 2
+    return None
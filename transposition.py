@@ -0,0 +1,159 @@
+from array import array
+from typing import Optional, Tuple
+
+# Typy wpisów (0 oznacza pusty slot)
+BOUND_EXACT = 1
+BOUND_LOWER = 2
+BOUND_UPPER = 3
+
+# Układ spakowanego wpisu (64 bity):
+#   bity 0-3   : ruch + 1 (0 = brak ruchu)
+#   bity 4-5   : typ wpisu
+#   bity 6-13  : głębokość
+#   bity 14-21 : generacja (numer przeszukiwania)
+#   bity 22-63 : wynik w zapisie stałoprzecinkowym, przesunięty o SCORE_OFFSET
+MOVE_BITS = 4
+BOUND_SHIFT = 4
+DEPTH_SHIFT = 6
+GENERATION_SHIFT = 14
+SCORE_SHIFT = 22
+SCORE_SCALE = 64
+SCORE_OFFSET = 1 << 41
+
+ENTRY_BYTES = 16  # klucz + spakowane dane
+BUCKET_SIZE = 2   # slot "głębokość ważniejsza" + slot "zawsze zastępuj"
+
+
+class TranspositionTable:
+    """
+    Transposition table o stałym rozmiarze, oparta na tablicy array('Q').
+
+    Każdy wpis to dwa 64-bitowe słowa: klucz Zobrista zapisany jako klucz XOR dane
+    oraz spakowane dane (wynik, głębokość, typ, ruch, generacja). Przy odczycie
+    klucz odtwarzany jest z obu słów, więc wpis "rozerwany" przez równoległy zapis
+    innego procesu (tabela we współdzielonej pamięci, bez blokad) po prostu nie
+    pasuje do klucza i jest traktowany jak brak trafienia. Wpisy są pogrupowane
+    w kubełki po dwa sloty:
+
+    - slot 0 zastępowany tylko przez wpis co najmniej tak głęboki albo gdy
+      pochodzi z poprzedniego przeszukiwania (starsza generacja),
+    - slot 1 zastępowany zawsze.
+
+    Pozycja, która ma już wpis w kubełku (w dowolnym slocie), jest aktualizowana w miejscu.
+
+    Pamięć jest alokowana raz - przy pierwszym użyciu tabeli (utworzenie silnika, np.
+    w nowym procesie, nic nie kosztuje) - więc tabela nigdy nie rośnie ani nie jest
+    kopiowana. Zamiast własnej tablicy można podać bufor (np. memoryview pamięci współdzielonej
+    rzutowany na 'Q') o rozmiarze co najmniej table_bytes(size_mb).
+    """
+
+    def __init__(self, size_mb: int = 16, buffer=None):
+        n_buckets = self.bucket_count(size_mb)
+
+        self.size_mb = size_mb
+        self.n_entries = n_buckets * BUCKET_SIZE
+        self.bucket_mask = n_buckets - 1
+        if buffer is not None:
+            self.table = buffer
+
+        self.generation = 0
+        self.used = 0
+        self.probes = 0
+        self.hits = 0
+
+    def __getattr__(self, name: str):
+        """Alokuje tablicę wpisów przy pierwszym odwołaniu do self.table."""
+        if name != 'table':
+            raise AttributeError(name)
+        self.table = array('Q', bytes(self.n_entries * ENTRY_BYTES))
+        return self.table
+
+    @staticmethod
+    def bucket_count(size_mb: int) -> int:
+        """Liczba kubełków (potęga dwójki) mieszczących się w size_mb megabajtach."""
+        max_buckets = max(1, size_mb * 1024 * 1024 // (ENTRY_BYTES * BUCKET_SIZE))
+        return 1 << (max_buckets.bit_length() - 1)
+
+    @classmethod
+    def table_bytes(cls, size_mb: int) -> int:
+        """Rozmiar w bajtach tablicy wpisów dla danego size_mb."""
+        return cls.bucket_count(size_mb) * BUCKET_SIZE * ENTRY_BYTES
+
+    def new_search(self):
+        """Rozpoczyna nową generację - wpisy z poprzednich ruchów stają się tańsze do zastąpienia."""
+        self.generation = (self.generation + 1) & 0xFF
+
+    def clear(self):
+        """Czyści całą tabelę (w miejscu - bufor może być współdzielony)."""
+        self.table[:] = array('Q', bytes(len(self.table) * 8))
+        self.used = 0
+        self.probes = 0
+        self.hits = 0
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, float, Optional[int]]]:
+        """Zwraca (głębokość, typ, wynik, ruch) dla klucza albo None."""
+        self.probes += 1
+        table = self.table
+        index = (key & self.bucket_mask) * (BUCKET_SIZE * 2)
+
+        for slot in range(index, index + BUCKET_SIZE * 2, 2):
+            data = table[slot + 1]
+            if data and table[slot] ^ data == key:
+                self.hits += 1
+                return self.unpack(data)
+        return None
+
+    def store(self, key: int, depth: int, bound: int, score: float, move: Optional[int]):
+        """Zapisuje wpis zgodnie z polityką zastępowania kubełka."""
+        table = self.table
+        slot = (key & self.bucket_mask) * (BUCKET_SIZE * 2)
+
+        # Wpis tej samej pozycji jest nadpisywany w swoim slocie (bez duplikatu klucza
+        # i bez wypierania innej pozycji ze slotu 0). Dla nowej pozycji - slot 0, gdy
+        # jest pusty, stary albo płytszy, inaczej slot 1
+        data = table[slot + 1]
+        if data and table[slot] ^ data != key:
+            second = table[slot + 3]
+            if second and table[slot + 2] ^ second == key:
+                slot += 2
+                data = second
+            else:
+                stored_depth = (data >> DEPTH_SHIFT) & 0xFF
+                stored_generation = (data >> GENERATION_SHIFT) & 0xFF
+                if stored_generation == self.generation and stored_depth > depth:
+                    slot += 2
+                    data = table[slot + 1]
+
+        if not data:
+            self.used += 1
+        data = self.pack(depth, bound, score, move)
+        table[slot] = key ^ data
+        table[slot + 1] = data
+
+    def pack(self, depth: int, bound: int, score: float, move: Optional[int]) -> int:
+        """Pakuje dane wpisu w jedno 64-bitowe słowo."""
+        return ((int(round(score * SCORE_SCALE)) + SCORE_OFFSET) << SCORE_SHIFT
+                | self.generation << GENERATION_SHIFT
+                | min(depth, 0xFF) << DEPTH_SHIFT
+                | bound << BOUND_SHIFT
+                | (0 if move is None else move + 1))
+
+    @staticmethod
+    def unpack(data: int) -> Tuple[int, int, float, Optional[int]]:
+        """Rozpakowuje słowo danych na (głębokość, typ, wynik, ruch)."""
+        move = (data & ((1 << MOVE_BITS) - 1)) - 1
+        return ((data >> DEPTH_SHIFT) & 0xFF,
+                (data >> BOUND_SHIFT) & 0x3,
+                ((data >> SCORE_SHIFT) - SCORE_OFFSET) / SCORE_SCALE,
+                None if move < 0 else move)
+
+    def hit_rate(self) -> float:
+        """Odsetek trafień w stosunku do wszystkich zapytań."""
+        return self.hits / max(self.probes, 1)
+
+    def fill_level(self) -> float:
+        """Odsetek zajętych slotów."""
+        return self.used / self.n_entries
+
+    def __len__(self) -> int:
+        return self.used
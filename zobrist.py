@@ -0,0 +1,38 @@
+import random
+from functools import lru_cache
+from typing import List, Tuple
+
+# Stałe ziarno - klucze muszą być identyczne we wszystkich procesach i uruchomieniach
+ZOBRIST_SEED = 0x5EED_C4
+
+ZOBRIST_BITS = 64
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(n_rows: int, n_columns: int) -> Tuple[List[List[List[int]]], int]:
+    """
+    Zwraca klucze Zobrista dla danej geometrii planszy.
+
+    Wynik to para (cell_keys, side_key), gdzie cell_keys[player][col][row] to losowy
+    64-bitowy klucz dla pionka gracza na polu (col, row), a side_key jest
+    dołączany (XOR) przy każdej zmianie gracza na ruchu.
+    """
+    rng = random.Random(ZOBRIST_SEED * 1009 + n_rows * 31 + n_columns)
+    cell_keys = [[[rng.getrandbits(ZOBRIST_BITS) for _ in range(n_rows)]
+                  for _ in range(n_columns)]
+                 for _ in range(2)]
+    side_key = rng.getrandbits(ZOBRIST_BITS)
+    return cell_keys, side_key
+
+
+@lru_cache(maxsize=None)
+def get_move_keys(n_rows: int, n_columns: int) -> List[List[List[Tuple[int, int]]]]:
+    """
+    Zwraca move_keys[player][col][row] = (zmiana klucza pozycji, zmiana klucza odbicia
+    lustrzanego) przy postawieniu pionka gracza na polu (col, row) - razem ze zmianą
+    gracza na ruchu, więc make_move / undo_move robią tylko dwa XOR-y.
+    """
+    cell_keys, side_key = get_zobrist_keys(n_rows, n_columns)
+    return [[[(cells[col][row] ^ side_key, cells[n_columns - 1 - col][row] ^ side_key)
+              for row in range(n_rows)] for col in range(n_columns)]
+            for cells in cell_keys]